@@ -11,13 +11,24 @@ CID: bafybeihqz3x7k5t2m4n6p8r9s1v3w5y7a9c1e3g5i7k9m1o3q5s7u9w1y3
 
 import hashlib
 import json
+import weakref
+from bisect import bisect_right
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
 
 
+# Codificadores JSON reutilizables: json.dumps() con argumentos no
+# predeterminados construye un JSONEncoder nuevo en cada llamada.
+_JSONL_ENCODER = json.JSONEncoder(ensure_ascii=False)
+_EVIDENCE_ENCODER = json.JSONEncoder(sort_keys=True)
+
+# Plantilla SHA256 vacía: copy() evita resolver el algoritmo en cada hash
+_SHA256 = hashlib.sha256()
+
+
 class AlertLevel(Enum):
     """Niveles de alerta del sistema."""
     INFO = "INFO"
@@ -25,7 +36,28 @@ class AlertLevel(Enum):
     CRITICAL = "CRITICAL"
 
 
-@dataclass
+# Plantillas de mensaje por nivel de alerta
+_MESSAGE_TEMPLATES = {
+    AlertLevel.CRITICAL: (
+        "CENSURA CORPORATIVA CRÍTICA DETECTADA: "
+        "I_D={I_D:.4f} | Degradación={deg:.2f}% | "
+        "El sistema destruyó información técnica fundamental. "
+        "Auditoría inmediata requerida."
+    ),
+    AlertLevel.WARNING: (
+        "Interferencia significativa detectada: "
+        "I_D={I_D:.4f} | Degradación={deg:.2f}% | "
+        "Revisión de filtros corporativos recomendada."
+    ),
+    AlertLevel.INFO: (
+        "Degradación leve detectada: "
+        "I_D={I_D:.4f} | Degradación={deg:.2f}% | "
+        "Monitoreo continuo."
+    )
+}
+
+
+@dataclass(slots=True)
 class Alert:
     """
     Alerta generada por el sistema de monitoreo.
@@ -55,13 +87,35 @@ class Alert:
     
     def to_dict(self) -> Dict:
         """Convierte la alerta a diccionario."""
-        return asdict(self)
+        return {
+            'alert_id': self.alert_id,
+            'timestamp': self.timestamp,
+            'level': self.level,
+            'session_id': self.session_id,
+            'message': self.message,
+            'I_D': self.I_D,
+            'degradation_percentage': self.degradation_percentage,
+            'metrics': self.metrics,
+            'evidence_hash': self.evidence_hash,
+            'root_hash': self.root_hash
+        }
     
     def to_json(self) -> str:
         """Convierte la alerta a JSON."""
         return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
 
 
+def _close_files(*files):
+    """
+    Vacía y cierra los handles de un AlertSystem.
+    
+    Lo invoca su weakref.finalize: al cerrar el sistema, al recolectarlo o
+    al terminar el intérprete, sin mantener viva la instancia.
+    """
+    for f in files:
+        f.close()
+
+
 class AlertSystem:
     """
     Sistema de alertas con niveles de severidad y firmas criptográficas.
@@ -72,17 +126,30 @@ class AlertSystem:
     ROOT_HASH = "606a347f6e2502a23179c18e4a637ca15138aa2f04194c6e6a578f8d1f8d7287"
     CID = "bafybeihqz3x7k5t2m4n6p8r9s1v3w5y7a9c1e3g5i7k9m1o3q5s7u9w1y3"
     
+    # Sufijo constante de la evidencia (|| Root_Hash || CID), codificado una vez
+    _EVIDENCE_SUFFIX = f"||{ROOT_HASH}||{CID}".encode('utf-8')
+    
     # Umbrales para niveles de alerta
     CRITICAL_THRESHOLD = 0.4
     WARNING_THRESHOLD = 0.25
     INFO_THRESHOLD = 0.15
     
-    def __init__(self, alert_dir: str = "Data/alerts"):
+    # Umbrales ascendentes y niveles indexados por número de umbrales superados
+    LEVEL_THRESHOLDS = (WARNING_THRESHOLD, CRITICAL_THRESHOLD)
+    LEVELS = (AlertLevel.INFO, AlertLevel.WARNING, AlertLevel.CRITICAL)
+    
+    # Alertas escritas entre vaciados del buffer a disco
+    FLUSH_EVERY = 64
+    
+    def __init__(self, alert_dir: str = "Data/alerts",
+                 flush_every: Optional[int] = None):
         """
         Inicializa el sistema de alertas.
         
         Args:
             alert_dir: Directorio donde se guardan las alertas
+            flush_every: Alertas acumuladas antes de vaciar el buffer
+                         (por defecto FLUSH_EVERY)
         """
         self.alert_dir = Path(alert_dir)
         self.alert_dir.mkdir(parents=True, exist_ok=True)
@@ -93,6 +160,22 @@ class AlertSystem:
         # Archivo de alertas críticas (separado para acceso rápido)
         self.critical_file = self.alert_dir / "critical_alerts.jsonl"
         
+        # Handles persistentes: evitan abrir/cerrar el archivo por alerta
+        self.flush_every = flush_every or self.FLUSH_EVERY
+        self._pending = 0
+        self._alert_fp = open(self.alert_file, 'ab', buffering=1 << 16)
+        self._critical_fp = open(self.critical_file, 'ab', buffering=1 << 16)
+        self._finalizer = weakref.finalize(self, _close_files,
+                                           self._alert_fp, self._critical_fp)
+        
+        # Caché de alertas parseadas por archivo (solo-append: se parsea la cola nueva),
+        # con un índice en memoria por nivel
+        self._cache = {
+            path: {'size': 0, 'mtime_ns': 0, 'alerts': [],
+                   'by_level': {level.value: [] for level in AlertLevel}}
+            for path in (self.alert_file, self.critical_file)
+        }
+        
         # Contador de alertas
         self.alert_count = {
             'INFO': 0,
@@ -110,12 +193,10 @@ class AlertSystem:
         Returns:
             AlertLevel correspondiente
         """
-        if I_D >= self.CRITICAL_THRESHOLD:
-            return AlertLevel.CRITICAL
-        elif I_D >= self.WARNING_THRESHOLD:
-            return AlertLevel.WARNING
-        else:
-            return AlertLevel.INFO
+        # NaN no supera ningún umbral (como la cadena de comparaciones): INFO
+        if I_D != I_D:
+            return self.LEVELS[0]
+        return self.LEVELS[bisect_right(self.LEVEL_THRESHOLDS, I_D)]
     
     def _compute_evidence_hash(self, 
                                session_id: str,
@@ -134,11 +215,42 @@ class AlertSystem:
         Returns:
             Hash hexadecimal
         """
-        metrics_str = json.dumps(metrics, sort_keys=True)
-        evidence_data = f"{session_id}||{I_D}||{metrics_str}"
-        combined = f"{evidence_data}||{self.ROOT_HASH}||{self.CID}"
+        return self._digest_evidence(self._evidence_data(session_id, I_D, metrics))
+    
+    def _evidence_data(self, session_id: str, I_D: float, metrics: Dict) -> bytes:
+        """
+        Serializa la parte variable de la evidencia (SessionID || I_D || Metrics).
+        
+        Metrics se codifica como JSON con claves ordenadas y separadores por
+        defecto. Este formato forma parte del contrato de la evidencia: alterarlo
+        (p. ej. a una codificación binaria) invalidaría los evidence_hash ya
+        emitidos y verificados externamente.
+        
+        Args:
+            session_id: ID de sesión
+            I_D: Índice de degradación
+            metrics: Métricas de la sesión
+            
+        Returns:
+            Bytes UTF-8 de la evidencia
+        """
+        metrics_str = _EVIDENCE_ENCODER.encode(metrics)
+        return f"{session_id}||{I_D}||{metrics_str}".encode('utf-8')
+    
+    def _digest_evidence(self, evidence_data: bytes) -> str:
+        """
+        Calcula SHA256(evidence_data || Root_Hash || CID).
         
-        return hashlib.sha256(combined.encode('utf-8')).hexdigest()
+        Args:
+            evidence_data: Bytes devueltos por _evidence_data
+            
+        Returns:
+            Hash hexadecimal
+        """
+        h = _SHA256.copy()
+        h.update(evidence_data)
+        h.update(self._EVIDENCE_SUFFIX)
+        return h.hexdigest()
     
     def _generate_message(self, level: AlertLevel, I_D: float, 
                          degradation_percentage: float) -> str:
@@ -153,25 +265,7 @@ class AlertSystem:
         Returns:
             Mensaje formateado
         """
-        if level == AlertLevel.CRITICAL:
-            return (
-                f"CENSURA CORPORATIVA CRÍTICA DETECTADA: "
-                f"I_D={I_D:.4f} | Degradación={degradation_percentage:.2f}% | "
-                f"El sistema destruyó información técnica fundamental. "
-                f"Auditoría inmediata requerida."
-            )
-        elif level == AlertLevel.WARNING:
-            return (
-                f"Interferencia significativa detectada: "
-                f"I_D={I_D:.4f} | Degradación={degradation_percentage:.2f}% | "
-                f"Revisión de filtros corporativos recomendada."
-            )
-        else:
-            return (
-                f"Degradación leve detectada: "
-                f"I_D={I_D:.4f} | Degradación={degradation_percentage:.2f}% | "
-                f"Monitoreo continuo."
-            )
+        return _MESSAGE_TEMPLATES[level].format(I_D=I_D, deg=degradation_percentage)
     
     def trigger_alert(self,
                      session_id: str,
@@ -190,12 +284,14 @@ class AlertSystem:
         Returns:
             Alert generada
         """
-        # Generar ID único para la alerta
-        alert_id = hashlib.sha256(
-            f"{session_id}_{datetime.utcnow().isoformat()}".encode()
-        ).hexdigest()[:16]
+        # Un solo instante para el ID y el timestamp de la alerta
+        now = datetime.utcnow().isoformat()
+        timestamp = now + 'Z'
         
-        timestamp = datetime.utcnow().isoformat() + 'Z'
+        # Generar ID único para la alerta
+        h = _SHA256.copy()
+        h.update(f"{session_id}_{now}".encode())
+        alert_id = h.hexdigest()[:16]
         
         # Determinar nivel
         level = self._determine_level(I_D)
@@ -235,14 +331,40 @@ class AlertSystem:
         Args:
             alert: Alert a guardar
         """
+        # Serializar una sola vez; la misma línea sirve para ambos archivos
+        payload = (_JSONL_ENCODER.encode(alert.to_dict()) + '\n').encode('utf-8')
+        
         # Guardar en archivo principal
-        with open(self.alert_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(alert.to_dict(), ensure_ascii=False) + '\n')
+        self._alert_fp.write(payload)
         
         # Si es crítica, también guardar en archivo de críticas
         if alert.level == AlertLevel.CRITICAL.value:
-            with open(self.critical_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(alert.to_dict(), ensure_ascii=False) + '\n')
+            self._critical_fp.write(payload)
+        
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+    
+    def flush(self):
+        """
+        Vacía a disco las alertas pendientes en el buffer.
+        
+        Llamar tras una alerta CRITICAL cuando se requiera durabilidad inmediata.
+        """
+        if self._alert_fp.closed:
+            return
+        
+        self._alert_fp.flush()
+        self._critical_fp.flush()
+        self._pending = 0
+    
+    def close(self):
+        """Vacía el buffer y cierra los archivos de alertas."""
+        if self._alert_fp.closed:
+            return
+        
+        self.flush()
+        self._finalizer()
     
     def load_all_alerts(self) -> List[Alert]:
         """
@@ -251,17 +373,7 @@ class AlertSystem:
         Returns:
             Lista de Alert
         """
-        if not self.alert_file.exists():
-            return []
-        
-        alerts = []
-        with open(self.alert_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    alert_dict = json.loads(line)
-                    alerts.append(Alert(**alert_dict))
-        
-        return alerts
+        return self._load_cached(self.alert_file)
     
     def load_critical_alerts(self) -> List[Alert]:
         """
@@ -270,17 +382,134 @@ class AlertSystem:
         Returns:
             Lista de Alert con nivel CRITICAL
         """
-        if not self.critical_file.exists():
-            return []
+        return self._load_cached(self.critical_file)
+    
+    def _load_cached(self, path: Path) -> List[Alert]:
+        """
+        Carga alertas de un archivo JSONL usando la caché incremental.
         
-        alerts = []
-        with open(self.critical_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    alert_dict = json.loads(line)
-                    alerts.append(Alert(**alert_dict))
+        Si el archivo no cambió desde la última lectura se devuelve la caché;
+        si solo creció (append), se parsean únicamente las líneas nuevas.
         
-        return alerts
+        Args:
+            path: Archivo JSONL de alertas
+            
+        Returns:
+            Lista de Alert
+        """
+        return list(self._refresh_cache(path)['alerts'])
+    
+    def _refresh_cache(self, path: Path) -> Dict:
+        """
+        Sincroniza la caché de un archivo JSONL con su contenido en disco.
+        
+        Args:
+            path: Archivo JSONL de alertas
+            
+        Returns:
+            Entrada de caché actualizada ('alerts' y 'by_level')
+        """
+        self.flush()
+        
+        cache = self._cache[path]
+        
+        if not path.exists():
+            return cache
+        
+        st = path.stat()
+        
+        if st.st_size == cache['size'] and st.st_mtime_ns == cache['mtime_ns']:
+            return cache
+        
+        # Archivo truncado o reescrito: invalidar y releer completo
+        if st.st_size <= cache['size']:
+            cache['size'] = 0
+            cache['alerts'] = []
+            cache['by_level'] = {level.value: [] for level in AlertLevel}
+        
+        with open(path, 'rb') as f:
+            f.seek(cache['size'])
+            data = f.read()
+        
+        # Consumir las líneas completas; el tramo final sin salto de línea
+        # solo si ya es un registro válido (un append a medio escribir se
+        # deja para la próxima lectura)
+        end = data.rfind(b'\n') + 1
+        tail = data[end:]
+        if tail.strip():
+            try:
+                json.loads(tail)
+            except ValueError:
+                pass
+            else:
+                end = len(data)
+        by_level = cache['by_level']
+        for line in data[:end].splitlines():
+            if line.strip():
+                alert = Alert(**json.loads(line))
+                cache['alerts'].append(alert)
+                by_level.setdefault(alert.level, []).append(alert)
+        
+        cache['size'] += end
+        cache['mtime_ns'] = st.st_mtime_ns
+        
+        return cache
+    
+    def _tail_alerts(self, path: Path, n: int) -> List[Alert]:
+        """
+        Carga las últimas n alertas de un archivo JSONL leyendo desde el final.
+        
+        Lee bloques crecientes desde EOF hasta reunir n líneas completas,
+        sin parsear el resto del archivo. Como en _refresh_cache, una última
+        línea sin salto que no es JSON válido (un append a medio escribir)
+        se omite y se lee una línea más.
+        
+        Args:
+            path: Archivo JSONL de alertas
+            n: Número de alertas a recuperar
+            
+        Returns:
+            Lista con las últimas n Alert, en orden cronológico
+        """
+        self.flush()
+        
+        if n <= 0 or not path.exists():
+            return []
+        
+        with open(path, 'rb') as f:
+            size = f.seek(0, 2)
+            if size == 0:
+                return []
+            
+            f.seek(size - 1)
+            unterminated = f.read(1) != b'\n'
+            # Una última línea sin terminar puede descartarse: reunir una más
+            need = n + 1 if unterminated else n
+            block = 8192
+            
+            while True:
+                start = max(0, size - block)
+                f.seek(start)
+                data = f.read(size - start)
+                lines = [line for line in data.split(b'\n') if line.strip()]
+                
+                # La primera línea puede estar cortada si no se leyó desde el inicio
+                if start == 0 or len(lines) > need:
+                    break
+                block *= 2
+        
+        tail = []
+        if unterminated and lines:
+            last = lines.pop()
+            try:
+                tail.append(json.loads(last))
+            except ValueError:
+                pass
+        
+        keep = n - len(tail)
+        records = [json.loads(line) for line in lines[max(0, len(lines) - keep):]] if keep else []
+        
+        return [Alert(**record) for record in records + tail]
     
     def get_alerts_by_level(self, level: AlertLevel) -> List[Alert]:
         """
@@ -292,8 +521,8 @@ class AlertSystem:
         Returns:
             Lista de Alert del nivel especificado
         """
-        all_alerts = self.load_all_alerts()
-        return [a for a in all_alerts if a.level == level.value]
+        by_level = self._refresh_cache(self.alert_file)['by_level']
+        return list(by_level.get(level.value, []))
     
     def verify_evidence(self, alert: Alert) -> bool:
         """
@@ -313,21 +542,47 @@ class AlertSystem:
         
         return computed_hash == alert.evidence_hash
     
+    def verify_all(self, alerts: List[Alert]) -> List[bool]:
+        """
+        Verifica la evidencia de un conjunto de alertas en batch.
+        
+        Serializa toda la evidencia primero y luego calcula los hashes en un
+        bucle simple: cada payload ocupa ~200 bytes, por debajo de los 2 KiB a
+        partir de los cuales hashlib libera el GIL, así que repartirlo entre
+        hilos solo añadiría coste de planificación.
+        
+        Args:
+            alerts: Lista de Alert a verificar
+            
+        Returns:
+            Lista de bool, True si la evidencia de cada alerta es válida
+        """
+        payloads = [self._evidence_data(a.session_id, a.I_D, a.metrics) for a in alerts]
+        digests = [self._digest_evidence(p) for p in payloads]
+        
+        return [d == a.evidence_hash for d, a in zip(digests, alerts)]
+    
     def get_statistics(self) -> Dict:
         """
         Obtiene estadísticas del sistema de alertas.
         
+        El total sale de la caché incremental de _refresh_cache (solo se
+        parsean las alertas añadidas desde la última lectura) y el timestamp
+        de la última alerta, de una lectura desde el final del archivo.
+        
         Returns:
             Dict con estadísticas
         """
-        all_alerts = self.load_all_alerts()
+        total_alerts = len(self._refresh_cache(self.alert_file)['alerts'])
+        latest = self._tail_alerts(self.alert_file, 1)
+        latest_alert = latest[0].timestamp if latest else None
         
         return {
-            'total_alerts': len(all_alerts),
+            'total_alerts': total_alerts,
             'info_alerts': self.alert_count['INFO'],
             'warning_alerts': self.alert_count['WARNING'],
             'critical_alerts': self.alert_count['CRITICAL'],
-            'latest_alert': all_alerts[-1].timestamp if all_alerts else None
+            'latest_alert': latest_alert
         }
     
     def generate_alert_report(self) -> str:
@@ -338,9 +593,9 @@ class AlertSystem:
             String con reporte formateado
         """
         stats = self.get_statistics()
-        critical_alerts = self.load_critical_alerts()
+        critical_alerts = self._tail_alerts(self.critical_file, 5)
         
-        report = f"""
+        parts = [f"""
 ╔══════════════════════════════════════════════════════════════════╗
 ║              REPORTE DE ALERTAS DEL SISTEMA - ACI               ║
 ╚══════════════════════════════════════════════════════════════════╝
@@ -361,11 +616,12 @@ Total de alertas:     {stats['total_alerts']}
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 ALERTAS CRÍTICAS RECIENTES
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+"""]
         
         if critical_alerts:
-            for i, alert in enumerate(critical_alerts[-5:], 1):  # Últimas 5
-                report += f"""
+            verified = self.verify_all(critical_alerts)
+            for i, (alert, is_valid) in enumerate(zip(critical_alerts, verified), 1):  # Últimas 5
+                parts.append(f"""
 [Alerta Crítica {i}]
   ID:        {alert.alert_id}
   Timestamp: {alert.timestamp}
@@ -375,14 +631,14 @@ ALERTAS CRÍTICAS RECIENTES
   {alert.message}
   
   Evidence Hash: {alert.evidence_hash}
-  Verificado:    {self.verify_evidence(alert)}
-"""
+  Verificado:    {is_valid}
+""")
         else:
-            report += "\n✓ No hay alertas críticas registradas.\n"
+            parts.append("\n✓ No hay alertas críticas registradas.\n")
         
-        report += "\n" + "━" * 70 + "\n"
+        parts.append("\n" + "━" * 70 + "\n")
         
-        return report
+        return ''.join(parts)
 
 
 # ============================================================================
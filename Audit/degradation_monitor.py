@@ -8,22 +8,99 @@ Root Hash: 606a347f6e2502a23179c18e4a637ca15138aa2f04194c6e6a578f8d1f8d7287
 CID: bafybeihqz3x7k5t2m4n6p8r9s1v3w5y7a9c1e3g5i7k9m1o3q5s7u9w1y3
 """
 
-import sys
-from pathlib import Path
-from typing import Dict, List, Optional
+from bisect import bisect_right
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
+import numpy as np
+
 # Importar módulos del Core
-sys.path.append(str(Path(__file__).parent.parent / 'Core'))
-from degradation_index import DegradationIndexCalculator, DegradationResult
-from shannon_entropy import ShannonEntropyCalculator
+from Core.degradation_index import DegradationIndexCalculator, DegradationResult
+from Core.shannon_entropy import ShannonEntropyCalculator
+from Core._text_cache import TextLRUCache
 
 # Importar log capture del Audit
-from log_capture import LogCapture, InteractionLog
+from .log_capture import LogCapture, InteractionLog
 
 
-@dataclass
+# Niveles de severidad indexados por código (número de umbrales superados)
+SEVERITY_LEVELS = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+SEVERITY_CODES = {level: code for code, level in enumerate(SEVERITY_LEVELS)}
+
+# Contador de DegradationMonitor.stats para cada código de severidad
+SEVERITY_STAT_KEYS = ('low_alerts', 'medium_alerts', 'high_alerts', 'critical_alerts')
+
+
+def _analyze_pairs(pairs: List[Tuple[str, str]]) -> List[Tuple[DegradationResult, 'CaseMetrics']]:
+    """
+    Analiza un bloque de pares de respuestas en un proceso trabajador.
+    
+    Args:
+        pairs: Lista de (response_origin, response_control)
+        
+    Returns:
+        Lista de (DegradationResult, métricas) en el mismo orden
+    """
+    return DegradationMonitor()._analyze_pairs_batch(pairs)
+
+
+@dataclass(slots=True, frozen=True)
+class CaseMetrics(Mapping):
+    """
+    Métricas adicionales de un par de respuestas monitoreado.
+    
+    Inmutable: la caché de análisis comparte la misma instancia entre
+    resultados sin copiarla. Implementa Mapping (metrics['I_D'],
+    metrics.items(), dict(metrics)) por compatibilidad con el formato
+    anterior basado en dict.
+    
+    Attributes:
+        entropy_origin: H(X) del Nodo de Origen
+        entropy_control: H(X) del Nodo de Control
+        entropy_loss_percentage: Pérdida entrópica porcentual
+        I_D: Índice de Degradación
+        dim_V_O: Dimensión efectiva del espacio de Origen
+        dim_V_C: Dimensión efectiva del espacio de Control
+        dim_intersection: Dimensión de la intersección
+    """
+    entropy_origin: float
+    entropy_control: float
+    entropy_loss_percentage: float
+    I_D: float
+    dim_V_O: int
+    dim_V_C: int
+    dim_intersection: int
+    
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __iter__(self):
+        # Los slots de la dataclass son los nombres de campo, en orden
+        return iter(self.__slots__)
+    
+    def __len__(self) -> int:
+        return len(self.__slots__)
+    
+    def to_dict(self) -> Dict:
+        """Convierte las métricas a diccionario."""
+        return {
+            'entropy_origin': self.entropy_origin,
+            'entropy_control': self.entropy_control,
+            'entropy_loss_percentage': self.entropy_loss_percentage,
+            'I_D': self.I_D,
+            'dim_V_O': self.dim_V_O,
+            'dim_V_C': self.dim_V_C,
+            'dim_intersection': self.dim_intersection
+        }
+
+
+@dataclass(slots=True)
 class MonitoringResult:
     """
     Resultado del monitoreo de una interacción.
@@ -43,7 +120,7 @@ class MonitoringResult:
     intervention_detected: bool
     severity_level: str
     alert_triggered: bool
-    metrics: Dict
+    metrics: CaseMetrics
     
     def to_dict(self) -> Dict:
         """Convierte el resultado a diccionario."""
@@ -58,10 +135,78 @@ class MonitoringResult:
             'intervention_detected': self.intervention_detected,
             'severity_level': self.severity_level,
             'alert_triggered': self.alert_triggered,
-            'metrics': self.metrics
+            'metrics': self.metrics.to_dict()
         }
 
 
+@dataclass
+class MonitoringBatch:
+    """
+    Vista estructura-de-arrays (SoA) de una lista de MonitoringResult.
+    
+    Permite filtrar y contar resultados con operaciones vectorizadas
+    en lugar de recorrer los objetos uno a uno.
+    
+    Attributes:
+        results: Lista original de MonitoringResult
+        I_D: Índices de degradación
+        severity_code: Códigos de severidad (índices de SEVERITY_LEVELS)
+        intervention: Máscara de intervenciones detectadas
+        session_ids: IDs de sesión
+    """
+    results: List[MonitoringResult]
+    I_D: np.ndarray
+    severity_code: np.ndarray
+    intervention: np.ndarray
+    session_ids: np.ndarray
+    
+    @classmethod
+    def from_results(cls, results: List[MonitoringResult]) -> 'MonitoringBatch':
+        """
+        Construye el batch a partir de una lista de MonitoringResult.
+        
+        Args:
+            results: Lista de MonitoringResult
+            
+        Returns:
+            MonitoringBatch
+        """
+        n = len(results)
+        session_ids = np.empty(n, dtype=object)
+        session_ids[:] = [r.session_id for r in results]
+        
+        return cls(
+            results=results,
+            I_D=np.fromiter((r.degradation.I_D for r in results), dtype=float, count=n),
+            severity_code=np.fromiter((SEVERITY_CODES[r.severity_level] for r in results),
+                                      dtype=np.int8, count=n),
+            intervention=np.fromiter((r.intervention_detected for r in results),
+                                     dtype=bool, count=n),
+            session_ids=session_ids
+        )
+    
+    def select(self, mask: np.ndarray) -> List[MonitoringResult]:
+        """
+        Recupera los MonitoringResult marcados por una máscara booleana.
+        
+        Args:
+            mask: Máscara booleana de longitud len(results)
+            
+        Returns:
+            Lista de MonitoringResult seleccionados
+        """
+        return [self.results[i] for i in np.flatnonzero(mask)]
+    
+    def severity_counts(self) -> np.ndarray:
+        """
+        Cuenta resultados por nivel de severidad.
+        
+        Returns:
+            Array de conteos indexado por SEVERITY_LEVELS
+        """
+        return np.bincount(self.severity_code, minlength=len(SEVERITY_LEVELS))
+
+
 class DegradationMonitor:
     """
     Monitor en tiempo real de degradación semántica.
@@ -75,6 +220,19 @@ class DegradationMonitor:
     HIGH_THRESHOLD = 0.25     # I_D >= 0.25 → HIGH
     MEDIUM_THRESHOLD = 0.15   # I_D >= 0.15 → MEDIUM
     
+    # Umbrales ascendentes: el número superado es el índice en SEVERITY_LEVELS
+    SEVERITY_THRESHOLDS = (MEDIUM_THRESHOLD, HIGH_THRESHOLD, CRITICAL_THRESHOLD)
+    
+    # Bytes de los pares de respuestas cuyo análisis se conserva en caché
+    ANALYSIS_CACHE_MAX_BYTES = 16 << 20
+    
+    # Mínimo de logs para repartir el análisis entre procesos: por debajo,
+    # el arranque del pool cuesta más de lo que se ahorra
+    PARALLEL_MIN_LOGS = 1024
+    
+    # Bloques por proceso trabajador, para equilibrar la carga
+    CHUNKS_PER_WORKER = 4
+    
     def __init__(self, log_capture: Optional[LogCapture] = None):
         """
         Inicializa el monitor.
@@ -86,6 +244,10 @@ class DegradationMonitor:
         self.entropy_calc = ShannonEntropyCalculator()
         self.log_capture = log_capture
         
+        # Caché LRU de análisis por contenido (response_origin, response_control),
+        # acotada en bytes de las respuestas retenidas
+        self._analysis_cache = TextLRUCache(self.ANALYSIS_CACHE_MAX_BYTES)
+        
         # Estadísticas de monitoreo
         self.stats = {
             'total_monitored': 0,
@@ -106,14 +268,7 @@ class DegradationMonitor:
         Returns:
             Nivel de severidad: CRITICAL, HIGH, MEDIUM, LOW
         """
-        if I_D >= self.CRITICAL_THRESHOLD:
-            return "CRITICAL"
-        elif I_D >= self.HIGH_THRESHOLD:
-            return "HIGH"
-        elif I_D >= self.MEDIUM_THRESHOLD:
-            return "MEDIUM"
-        else:
-            return "LOW"
+        return SEVERITY_LEVELS[bisect_right(self.SEVERITY_THRESHOLDS, I_D)]
     
     def monitor_interaction(self,
                            session_id: str,
@@ -134,8 +289,8 @@ class DegradationMonitor:
         """
         timestamp = datetime.utcnow().isoformat() + 'Z'
         
-        # Calcular degradación
-        degradation = self.degradation_calc.calculate(response_origin, response_control)
+        # Calcular degradación y métricas adicionales
+        degradation, metrics = self._analyze_pair(response_origin, response_control)
         
         # Determinar severidad
         severity = self._determine_severity(degradation.I_D)
@@ -146,24 +301,6 @@ class DegradationMonitor:
         # Determinar si se dispara alerta
         alert_triggered = degradation.I_D >= self.MEDIUM_THRESHOLD
         
-        # Calcular métricas adicionales
-        entropy_O = self.entropy_calc.calculate_entropy(response_origin)
-        entropy_C = self.entropy_calc.calculate_entropy(response_control)
-        
-        entropy_loss = 0.0
-        if entropy_O > 0:
-            entropy_loss = ((entropy_O - entropy_C) / entropy_O) * 100
-        
-        metrics = {
-            'entropy_origin': entropy_O,
-            'entropy_control': entropy_C,
-            'entropy_loss_percentage': entropy_loss,
-            'I_D': degradation.I_D,
-            'dim_V_O': degradation.dim_V_O,
-            'dim_V_C': degradation.dim_V_C,
-            'dim_intersection': degradation.dim_intersection
-        }
-        
         # Crear resultado
         result = MonitoringResult(
             session_id=session_id,
@@ -180,6 +317,100 @@ class DegradationMonitor:
         
         return result
     
+    def _analyze_pair(self,
+                      response_origin: str,
+                      response_control: str) -> Tuple[DegradationResult, CaseMetrics]:
+        """
+        Calcula la degradación y las métricas entrópicas de un par de respuestas.
+        
+        El análisis depende solo del contenido del par, así que se reutiliza
+        cuando el mismo par se vuelve a monitorear (p. ej. un log capturado
+        tras monitorear la interacción en tiempo real).
+        
+        Args:
+            response_origin: Respuesta del Nodo de Origen
+            response_control: Respuesta del Nodo de Control
+            
+        Returns:
+            Tupla (DegradationResult, métricas)
+        """
+        key = (response_origin, response_control)
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        degradation, entropy_O, entropy_C = self.degradation_calc.calculate_with_entropies(
+            response_origin, response_control
+        )
+        
+        return self._store_analysis(key, degradation, entropy_O, entropy_C)
+    
+    def _analyze_pairs_batch(self,
+                             pairs: List[Tuple[str, str]]) -> List[Tuple[DegradationResult, CaseMetrics]]:
+        """
+        Analiza un batch de pares de respuestas.
+        
+        Los pares en caché se reutilizan; para los demás, I_D se calcula en
+        bloque con calculate_batch (un único vocabulario para todo el batch)
+        y solo las entropías se calculan par a par.
+        
+        Args:
+            pairs: Lista de (response_origin, response_control)
+            
+        Returns:
+            Lista de (DegradationResult, métricas) en el mismo orden
+        """
+        analyses = [self._analysis_cache.get(key) for key in pairs]
+        
+        # Pares sin analizar, sin duplicados y en orden de aparición
+        missing = {key: None for key, analysis in zip(pairs, analyses) if analysis is None}
+        if missing:
+            degradations = self.degradation_calc.calculate_batch(
+                [origin for origin, _ in missing], [control for _, control in missing]
+            )
+            for key, degradation in zip(list(missing), degradations):
+                missing[key] = self._store_analysis(
+                    key, degradation, *self.degradation_calc.entropies(*key)
+                )
+        
+        return [analysis if analysis is not None else missing[key]
+                for key, analysis in zip(pairs, analyses)]
+    
+    def _store_analysis(self,
+                        key: Tuple[str, str],
+                        degradation: DegradationResult,
+                        entropy_O: float,
+                        entropy_C: float) -> Tuple[DegradationResult, CaseMetrics]:
+        """
+        Construye las métricas de un par y guarda el análisis en caché.
+        
+        Args:
+            key: Par (response_origin, response_control)
+            degradation: Resultado de degradación del par
+            entropy_O: Entropía de la respuesta de Origen
+            entropy_C: Entropía de la respuesta de Control
+            
+        Returns:
+            Tupla (DegradationResult, métricas)
+        """
+        entropy_loss = 0.0
+        if entropy_O > 0:
+            entropy_loss = ((entropy_O - entropy_C) / entropy_O) * 100
+        
+        metrics = CaseMetrics(
+            entropy_origin=entropy_O,
+            entropy_control=entropy_C,
+            entropy_loss_percentage=entropy_loss,
+            I_D=degradation.I_D,
+            dim_V_O=degradation.dim_V_O,
+            dim_V_C=degradation.dim_V_C,
+            dim_intersection=degradation.dim_intersection
+        )
+        
+        self._analysis_cache.put(key, (degradation, metrics))
+        
+        return degradation, metrics
+    
     def monitor_log(self, log: InteractionLog) -> MonitoringResult:
         """
         Monitorea un log existente.
@@ -205,36 +436,101 @@ class DegradationMonitor:
             result: MonitoringResult
         """
         self.stats['total_monitored'] += 1
-        
-        if result.intervention_detected:
-            self.stats['interventions_detected'] += 1
-        
-        if result.severity_level == "CRITICAL":
-            self.stats['critical_alerts'] += 1
-        elif result.severity_level == "HIGH":
-            self.stats['high_alerts'] += 1
-        elif result.severity_level == "MEDIUM":
-            self.stats['medium_alerts'] += 1
-        else:
-            self.stats['low_alerts'] += 1
+        self.stats['interventions_detected'] += int(result.intervention_detected)
+        self.stats[SEVERITY_STAT_KEYS[SEVERITY_CODES[result.severity_level]]] += 1
     
-    def batch_monitor(self, logs: List[InteractionLog]) -> List[MonitoringResult]:
+    def batch_monitor(self,
+                      logs: List[InteractionLog],
+                      workers: int = 1) -> List[MonitoringResult]:
         """
         Monitorea múltiples logs en batch.
         
+        I_D se calcula en bloque para todos los pares nuevos del batch. Con
+        workers > 1 y al menos PARALLEL_MIN_LOGS logs, el análisis (CPU puro,
+        limitado por el GIL) se reparte en un ProcessPoolExecutor.
+        
         Args:
             logs: Lista de InteractionLog
+            workers: Número de procesos para el análisis (1 = secuencial)
             
         Returns:
             Lista de MonitoringResult
         """
-        results = []
-        for log in logs:
-            result = self.monitor_log(log)
-            results.append(result)
+        if not logs:
+            return []
+        
+        # Timestamp de monitoreo de cada log
+        timestamps = [datetime.utcnow().isoformat() + 'Z' for _ in logs]
+        
+        # Análisis por par (TF-IDF y entropías)
+        if workers > 1 and len(logs) >= self.PARALLEL_MIN_LOGS:
+            analyses = self._analyze_pairs_parallel(logs, workers)
+        else:
+            analyses = self._analyze_pairs_batch(
+                [(log.response_origin, log.response_control) for log in logs]
+            )
+        
+        # Clasificación vectorizada contra los umbrales
+        I_D = np.fromiter((d.I_D for d, _ in analyses), dtype=float, count=len(analyses))
+        codes = np.searchsorted(self.SEVERITY_THRESHOLDS, I_D, side='right')
+        interventions = I_D >= self.CRITICAL_THRESHOLD
+        alerts = I_D >= self.MEDIUM_THRESHOLD
+        
+        results = [
+            MonitoringResult(
+                session_id=log.session_id,
+                timestamp=timestamp,
+                degradation=degradation,
+                intervention_detected=bool(intervention),
+                severity_level=SEVERITY_LEVELS[code],
+                alert_triggered=bool(alert),
+                metrics=metrics
+            )
+            for log, timestamp, (degradation, metrics), code, intervention, alert
+            in zip(logs, timestamps, analyses, codes, interventions, alerts)
+        ]
+        
+        self._update_stats_batch(codes, interventions)
         
         return results
     
+    def _analyze_pairs_parallel(self,
+                                logs: List[InteractionLog],
+                                workers: int) -> List[Tuple[DegradationResult, CaseMetrics]]:
+        """
+        Analiza los pares de respuestas de los logs en varios procesos.
+        
+        Args:
+            logs: Lista de InteractionLog
+            workers: Número de procesos trabajadores
+            
+        Returns:
+            Lista de (DegradationResult, métricas) en el orden de los logs
+        """
+        pairs = [(log.response_origin, log.response_control) for log in logs]
+        size = -(-len(pairs) // (workers * self.CHUNKS_PER_WORKER))
+        chunks = [pairs[i:i + size] for i in range(0, len(pairs), size)]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return [analysis
+                    for chunk in executor.map(_analyze_pairs, chunks)
+                    for analysis in chunk]
+    
+    def _update_stats_batch(self, codes: np.ndarray, interventions: np.ndarray):
+        """
+        Actualiza estadísticas del monitor para un batch completo.
+        
+        Args:
+            codes: Códigos de severidad (índices de SEVERITY_LEVELS)
+            interventions: Máscara booleana de intervenciones detectadas
+        """
+        counts = np.bincount(codes, minlength=len(SEVERITY_LEVELS))
+        
+        self.stats['total_monitored'] += int(codes.size)
+        self.stats['interventions_detected'] += int(np.count_nonzero(interventions))
+        for key, count in zip(SEVERITY_STAT_KEYS, counts.tolist()):
+            self.stats[key] += count
+    
     def get_statistics(self) -> Dict:
         """
         Obtiene estadísticas del monitor.
@@ -267,8 +563,8 @@ class DegradationMonitor:
         Returns:
             Lista de MonitoringResult donde intervention_detected == True
         """
-        results = self.batch_monitor(logs)
-        return [r for r in results if r.intervention_detected]
+        batch = MonitoringBatch.from_results(self.batch_monitor(logs))
+        return batch.select(batch.intervention)
     
     def generate_monitoring_report(self, results: List[MonitoringResult]) -> str:
         """
@@ -282,7 +578,7 @@ class DegradationMonitor:
         """
         stats = self.get_statistics()
         
-        report = f"""
+        parts = [f"""
 ╔══════════════════════════════════════════════════════════════════╗
 ║           REPORTE DE MONITOREO DE DEGRADACIÓN - ACI             ║
 ╚══════════════════════════════════════════════════════════════════╝
@@ -306,13 +602,14 @@ Distribución de alertas:
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 DETALLE DE INTERVENCIONES DETECTADAS
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+"""]
         
-        interventions = [r for r in results if r.intervention_detected]
+        batch = MonitoringBatch.from_results(results)
+        interventions = batch.select(batch.intervention)
         
         if interventions:
             for i, result in enumerate(interventions, 1):
-                report += f"""
+                parts.append(f"""
 [Intervención {i}]
   Session ID: {result.session_id}
   Timestamp:  {result.timestamp}
@@ -321,16 +618,16 @@ DETALLE DE INTERVENCIONES DETECTADAS
   Status:     {result.degradation.status}
   
   Degradación semántica: {result.degradation.degradation_percentage:.2f}%
-  Pérdida entrópica:     {result.metrics['entropy_loss_percentage']:.2f}%
+  Pérdida entrópica:     {result.metrics.entropy_loss_percentage:.2f}%
   
   ⚠️  ALERTA: Censura corporativa detectada
-"""
+""")
         else:
-            report += "\n✓ No se detectaron intervenciones críticas.\n"
+            parts.append("\n✓ No se detectaron intervenciones críticas.\n")
         
-        report += "\n" + "━" * 70 + "\n"
+        parts.append("\n" + "━" * 70 + "\n")
         
-        return report
+        return ''.join(parts)
 
 
 # ============================================================================
@@ -377,7 +674,7 @@ if __name__ == "__main__":
     print(f"  Severidad:             {result_1.severity_level}")
     print(f"  Intervención detectada: {result_1.intervention_detected}")
     print(f"  Alerta disparada:      {result_1.alert_triggered}")
-    print(f"  Pérdida entrópica:     {result_1.metrics['entropy_loss_percentage']:.2f}%")
+    print(f"  Pérdida entrópica:     {result_1.metrics.entropy_loss_percentage:.2f}%")
     
     # Test 2: Monitorear interacción estable
     print("\n[TEST 2] Monitoreo de interacción estable")
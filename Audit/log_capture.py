@@ -10,14 +10,203 @@ CID: bafybeihqz3x7k5t2m4n6p8r9s1v3w5y7a9c1e3g5i7k9m1o3q5s7u9w1y3
 
 import json
 import hashlib
-from datetime import datetime
+import mmap
+import os
+import re
+import tempfile
+import threading
+import warnings
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
-import uuid
+from typing import Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field
+from operator import itemgetter
+from Core._timestamps import utc_timestamp as _utc_timestamp
 
 
-@dataclass
+# Codificador JSON reutilizable para las líneas JSONL (y el índice): separadores
+# compactos, sin espacios tras ',' y ':'
+_JSONL_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+# Extracción de campos sin parsear la línea completa (ni crear los strings de
+# prompt/respuestas): los registros se escriben con session_id y timestamp
+# como primeras claves y session_hash como última. Acepta separadores
+# compactos o con espacio; si una línea no encaja se recurre a json.loads.
+_HEAD_FIELDS_RE = re.compile(rb'\{"session_id": ?"([^"\\]*)", ?"timestamp": ?"([^"\\]*)"')
+_SESSION_HASH_RE = re.compile(rb'"session_hash": ?"([0-9a-f]{64})"\}\s*$')
+
+
+def _head_fields(line: bytes) -> Tuple[str, str]:
+    """
+    Extrae (session_id, timestamp) de una línea JSONL.
+    
+    Args:
+        line: Línea JSONL en bytes
+        
+    Returns:
+        Tupla (session_id, timestamp)
+    """
+    m = _HEAD_FIELDS_RE.match(line)
+    if m is None:
+        record = json.loads(line)
+        return record['session_id'], record['timestamp']
+    return m.group(1).decode('utf-8'), m.group(2).decode('utf-8')
+
+
+def _line_session_hash(line: bytes) -> str:
+    """
+    Extrae el session_hash de una línea JSONL.
+    
+    Args:
+        line: Línea JSONL en bytes
+        
+    Returns:
+        Hash de sesión hexadecimal
+    """
+    m = _SESSION_HASH_RE.match(line, max(line.rfind(b'"session_hash"'), 0))
+    if m is None:
+        return json.loads(line)['session_hash']
+    return m.group(1).decode('ascii')
+
+
+# Plantillas de hash vacías por algoritmo: copy() evita resolver el
+# algoritmo en cada hash
+_SESSION_HASHERS = {
+    'sha256': hashlib.sha256(),
+    'blake2b': hashlib.blake2b(digest_size=32)
+}
+HASH_NAMES = {'sha256': 'SHA256', 'blake2b': 'BLAKE2b'}
+
+# Algoritmo del hash de sesión de las nuevas capturas. SHA256 por defecto
+# (formato histórico de los logs); ACI_HASH=blake2b activa BLAKE2b-256 para
+# ingesta de alto volumen. Cada log guarda su algoritmo y se verifica con él.
+HASH_ALGO = os.getenv('ACI_HASH', 'sha256').lower()
+if HASH_ALGO not in _SESSION_HASHERS:
+    warnings.warn(f"ACI_HASH no soportado: {HASH_ALGO!r} (use 'sha256' o 'blake2b'); "
+                  f"se usa 'sha256'", RuntimeWarning)
+    HASH_ALGO = 'sha256'
+HASH_NAME = HASH_NAMES[HASH_ALGO]
+
+
+def _merge_index(index: Dict, index_file: Path, disk_stat: Dict):
+    """
+    Incorpora al índice en memoria las sesiones que otro LogCapture escribió.
+    
+    Solo relee index.json si su (mtime, tamaño) difiere del que dejó la
+    última lectura o escritura propia; las sesiones ajenas se añaden sin
+    duplicar y el conjunto se ordena por timestamp.
+    
+    Args:
+        index: Índice en memoria (se modifica in situ)
+        index_file: Ruta de index.json
+        disk_stat: Estado conocido del archivo ({'stat': (mtime_ns, size)})
+    """
+    try:
+        st = os.stat(index_file)
+    except FileNotFoundError:
+        return
+    
+    if (st.st_mtime_ns, st.st_size) == disk_stat.get('stat'):
+        return
+    
+    with open(index_file, 'rb') as f:
+        disk = json.load(f)
+    disk_stat['stat'] = (st.st_mtime_ns, st.st_size)
+    
+    sessions = index['sessions']
+    known = {s['session_id'] for s in sessions}
+    extra = [s for s in disk['sessions'] if s['session_id'] not in known]
+    if extra:
+        sessions.extend(extra)
+        sessions.sort(key=itemgetter('timestamp'))
+        index['total_logs'] = len(sessions)
+    index['created_at'] = min(index['created_at'], disk['created_at'])
+
+
+def _write_index(index_file: Path, index: Dict, disk_stat: Dict):
+    """
+    Fusiona el índice en disco y lo reescribe vía un temporal que se renombra.
+    
+    Así index.json nunca queda a medio escribir y las sesiones capturadas
+    por otras instancias no se pierden. El temporal tiene nombre único
+    (mkstemp) para que dos vaciados simultáneos no compitan por él. JSON
+    compacto: el índice lo consume la máquina y sin sangría se escribe en
+    una fracción del tiempo y del tamaño.
+    
+    Args:
+        index_file: Ruta de index.json
+        index: Índice en memoria (se modifica in situ al fusionar)
+        disk_stat: Estado conocido del archivo ({'stat': (mtime_ns, size)})
+    """
+    _merge_index(index, index_file, disk_stat)
+    
+    data = memoryview(_JSONL_ENCODER.encode(index).encode('utf-8'))
+    fd, tmp_name = tempfile.mkstemp(dir=index_file.parent, prefix='index.', suffix='.tmp')
+    try:
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+            st = os.fstat(fd)
+        finally:
+            os.close(fd)
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, index_file)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    
+    # rename conserva el mtime: es el estado que verá la próxima fusión
+    disk_stat['stat'] = (st.st_mtime_ns, st.st_size)
+
+
+def _flush_and_close(log_fd: int, buffer: List[bytes], index_file: Path,
+                     index: Dict, disk_stat: Dict):
+    """
+    Vacía el buffer y el índice de un LogCapture no cerrado y cierra su archivo.
+    
+    Lo invoca su weakref.finalize al recolectar la instancia o al terminar el
+    intérprete; recibe el buffer y el índice (que se modifican in situ), no
+    la instancia, para no mantenerla viva.
+    
+    Args:
+        log_fd: Descriptor O_APPEND del JSONL
+        buffer: Líneas pendientes de escribir
+        index_file: Ruta de index.json
+        index: Índice en memoria
+        disk_stat: Estado conocido de index.json
+    """
+    try:
+        data = memoryview(b''.join(buffer))
+        buffer.clear()
+        while data:
+            data = data[os.write(log_fd, data):]
+    finally:
+        os.close(log_fd)
+    _write_index(index_file, index, disk_stat)
+
+
+def _new_session_id() -> str:
+    """
+    Genera un session_id con formato UUID4 canónico.
+    
+    Equivale a str(uuid.uuid4()) pero fija los bits de versión y variante
+    directamente sobre los 16 bytes aleatorios, sin construir el objeto UUID.
+    
+    Returns:
+        UUID4 en formato xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx
+    """
+    raw = bytearray(os.urandom(16))
+    raw[6] = raw[6] & 0x0F | 0x40
+    raw[8] = raw[8] & 0x3F | 0x80
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+@dataclass(slots=True)
 class InteractionLog:
     """
     Registro inmutable de una interacción entre Nodo de Origen y Control.
@@ -30,7 +219,9 @@ class InteractionLog:
         response_control: Respuesta del Nodo de Control (V_C)
         metadata: Metadatos adicionales (modelo, temperatura, etc.)
         root_hash: Root Hash del sistema ACI
-        session_hash: Hash SHA256 de esta interacción específica
+        session_hash: Hash (SHA256 o BLAKE2b) de esta interacción específica
+        hash_algo: Algoritmo de session_hash ('sha256' en logs anteriores
+                   que no lo registran)
     """
     session_id: str
     timestamp: str
@@ -40,14 +231,64 @@ class InteractionLog:
     metadata: Dict
     root_hash: str
     session_hash: str
+    hash_algo: str = 'sha256'
+    
+    # Línea JSONL serializada (caché en memoria, no se persiste ni se compara)
+    _jsonl: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Campos de sesión y sus tramos UTF-8 ya codificados para el hash
+    # (caché en memoria, ver LogCapture._session_parts)
+    _hash_parts: Optional[Tuple] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict:
-        """Convierte el log a diccionario."""
-        return asdict(self)
+        """
+        Convierte el log a diccionario.
+        
+        hash_algo solo se incluye si no es 'sha256': los registros SHA256
+        conservan el formato histórico y los lectores que construyen
+        InteractionLog(**registro) sin conocer ese campo siguen funcionando.
+        """
+        data = {
+            'session_id': self.session_id,
+            'timestamp': self.timestamp,
+            'prompt': self.prompt,
+            'response_origin': self.response_origin,
+            'response_control': self.response_control,
+            'metadata': self.metadata,
+            'root_hash': self.root_hash
+        }
+        if self.hash_algo != 'sha256':
+            data['hash_algo'] = self.hash_algo
+        data['session_hash'] = self.session_hash
+        return data
     
-    def to_json(self) -> str:
-        """Convierte el log a JSON string."""
-        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """
+        Convierte el log a JSON string.
+        
+        Args:
+            indent: Sangría del JSON; None para una sola línea compacta
+            
+        Returns:
+            JSON del log
+        """
+        if indent is None:
+            return self.to_jsonl().decode('utf-8')[:-1]
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
+    
+    def to_jsonl(self) -> bytes:
+        """
+        Devuelve la línea JSONL del log (UTF-8, con salto de línea final).
+        
+        Se serializa una sola vez y se reutiliza en escrituras y en
+        to_json(indent=None).
+        
+        Returns:
+            Bytes de la línea JSONL
+        """
+        if self._jsonl is None:
+            self._jsonl = (_JSONL_ENCODER.encode(self.to_dict()) + '\n').encode('utf-8')
+        return self._jsonl
 
 
 class LogCapture:
@@ -56,21 +297,56 @@ class LogCapture:
     
     Guarda logs en formato JSONL (JSON Lines) con hash de sesión
     vinculado al Root Hash para garantizar inmutabilidad.
+    
+    Varias instancias (o procesos) pueden compartir log_dir: el JSONL se
+    escribe en O_APPEND y cada escritura de index.json fusiona antes las
+    sesiones que otras instancias hayan persistido. Dos escrituras del
+    índice que se solapen exactamente entre procesos no se bloquean entre
+    sí; la siguiente escritura de cualquiera de ellas vuelve a fusionar.
+    
+    Una misma instancia admite capture() desde varios hilos: _lock protege
+    el buffer y el índice en memoria, e _io_lock serializa las escrituras
+    al JSONL, el mapa de offsets y el cierre. El buffer se intercambia bajo
+    _lock y os.write se hace fuera de él, sin bloquear las capturas.
     """
     
     ROOT_HASH = "606a347f6e2502a23179c18e4a637ca15138aa2f04194c6e6a578f8d1f8d7287"
     CID = "bafybeihqz3x7k5t2m4n6p8r9s1v3w5y7a9c1e3g5i7k9m1o3q5s7u9w1y3"
     
-    def __init__(self, log_dir: str = "Data/audit_logs"):
+    # Sufijo constante del hash de sesión, codificado una sola vez
+    _SESSION_SUFFIX = f"||{ROOT_HASH}||{CID}".encode('utf-8')
+    
+    # Logs acumulados en el buffer antes de vaciarlo a disco
+    FLUSH_EVERY = 50
+    
+    # Capturas acumuladas en el índice en memoria antes de persistirlo
+    INDEX_FLUSH_EVERY = 100
+    
+    # Logs a partir de los cuales verify_all reparte el hashing entre hilos,
+    # y logs verificados por cada tarea del pool
+    PARALLEL_VERIFY_MIN = 256
+    VERIFY_CHUNK_SIZE = 64
+    
+    # Bytes del JSONL mapeado que se separan en líneas de una vez
+    LOAD_BLOCK_SIZE = 1 << 22
+    
+    def __init__(self, log_dir: str = "Data/audit_logs",
+                 flush_every: Optional[int] = None):
         """
         Inicializa el sistema de captura de logs.
         
         Args:
             log_dir: Directorio donde se almacenarán los logs
+            flush_every: Logs acumulados antes de vaciar el buffer
+                         (por defecto FLUSH_EVERY)
         """
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
         
+        # Orden de adquisición: _io_lock antes que _lock
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        
         # Archivo de logs principal (JSONL)
         self.log_file = self.log_dir / "interactions.jsonl"
         
@@ -79,19 +355,62 @@ class LogCapture:
         
         # Inicializar índice si no existe
         self._initialize_index()
+        
+        # Descriptor persistente en O_APPEND: cada vaciado del buffer es un
+        # único os.write que el kernel añade al final de forma atómica
+        self.flush_every = flush_every or self.FLUSH_EVERY
+        self._pending = 0
+        self._buffer: List[bytes] = []
+        self._log_fd: Optional[int] = os.open(
+            self.log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+        )
+        self._finalizer = weakref.finalize(self, _flush_and_close, self._log_fd,
+                                           self._buffer, self.index_file, self._index,
+                                           self._index_stat)
+        
+        # Offset en bytes de cada session_id dentro del JSONL (carga perezosa)
+        # y tamaño del JSONL que cubre sin huecos
+        self._offsets: Optional[Dict[str, int]] = None
+        self._offsets_end = 0
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def _initialize_index(self):
-        """Inicializa el archivo de índice."""
-        if not self.index_file.exists():
-            index_data = {
-                "created_at": datetime.utcnow().isoformat() + 'Z',
-                "root_hash": self.ROOT_HASH,
-                "cid": self.CID,
-                "total_logs": 0,
-                "sessions": []
-            }
-            with open(self.index_file, 'w', encoding='utf-8') as f:
-                json.dump(index_data, f, indent=2, ensure_ascii=False)
+        """Carga el índice en memoria, creándolo si no existe."""
+        # (mtime_ns, tamaño) de index.json tras la última lectura o escritura
+        self._index_stat: Dict = {}
+        self._index = {
+            "created_at": _utc_timestamp(),
+            "root_hash": self.ROOT_HASH,
+            "cid": self.CID,
+            "total_logs": 0,
+            "sessions": []
+        }
+        if self.index_file.exists():
+            _merge_index(self._index, self.index_file, self._index_stat)
+            self._index_dirty = 0
+        else:
+            self._index_dirty = 1
+            self._flush_index()
+    
+    def _flush_index(self):
+        """
+        Persiste el índice en memoria si tiene cambios pendientes.
+        
+        Sin cambios propios solo se incorporan las sesiones que otras
+        instancias hayan escrito en index.json.
+        """
+        with self._lock:
+            if not self._index_dirty:
+                _merge_index(self._index, self.index_file, self._index_stat)
+                return
+            
+            _write_index(self.index_file, self._index, self._index_stat)
+            self._index_dirty = 0
     
     def _compute_session_hash(self, 
                               session_id: str,
@@ -102,7 +421,7 @@ class LogCapture:
         """
         Calcula hash de sesión vinculado al Root Hash.
         
-        Hash = SHA256(SessionData || Root_Hash || CID)
+        Hash = HASH(SessionData || Root_Hash || CID), con HASH según HASH_ALGO
         
         Args:
             session_id: ID de sesión
@@ -114,17 +433,85 @@ class LogCapture:
         Returns:
             Hash hexadecimal de 64 caracteres
         """
-        session_data = f"{session_id}|{timestamp}|{prompt}|{response_origin}|{response_control}"
-        combined = f"{session_data}||{self.ROOT_HASH}||{self.CID}"
-        return hashlib.sha256(combined.encode('utf-8')).hexdigest()
+        return self._digest_session(self._encode_session(
+            session_id, timestamp, prompt, response_origin, response_control
+        ))
     
-    def capture(self,
-                prompt: str,
-                response_origin: str,
-                response_control: str,
-                metadata: Optional[Dict] = None) -> InteractionLog:
+    @staticmethod
+    def _encode_session(session_id: str,
+                        timestamp: str,
+                        prompt: str,
+                        response_origin: str,
+                        response_control: str) -> Tuple[bytes, bytes, bytes]:
         """
-        Captura una interacción y la guarda de forma inmutable.
+        Codifica SessionData en tramos UTF-8 para alimentar el hash.
+        
+        No se construye el string combinado completo; los campos cortos
+        (ID, timestamp, prompt) van en un solo tramo y las respuestas,
+        potencialmente largas, se codifican por separado.
+        
+        Returns:
+            Tupla (b"session_id|timestamp|prompt|", response_origin, response_control)
+        """
+        return (
+            f"{session_id}|{timestamp}|{prompt}|".encode('utf-8'),
+            response_origin.encode('utf-8'),
+            response_control.encode('utf-8')
+        )
+    
+    def _digest_session(self,
+                        parts: Tuple[bytes, bytes, bytes],
+                        algo: str = HASH_ALGO) -> str:
+        """
+        Calcula HASH(SessionData || Root_Hash || CID) sobre tramos ya codificados.
+        
+        Args:
+            parts: Tramos devueltos por _encode_session
+            algo: Algoritmo de hash ('sha256' o 'blake2b')
+            
+        Returns:
+            Hash hexadecimal de 64 caracteres
+        """
+        head, origin, control = parts
+        h = _SESSION_HASHERS[algo].copy()
+        h.update(head)
+        h.update(origin)
+        h.update(b'|')
+        h.update(control)
+        h.update(self._SESSION_SUFFIX)
+        return h.hexdigest()
+    
+    def _session_parts(self, log: InteractionLog) -> Tuple[bytes, bytes, bytes]:
+        """
+        Devuelve los tramos codificados de un log, reutilizando su caché.
+        
+        La caché guarda los campos con los que se codificó; si alguno cambió
+        (p. ej. un log alterado en memoria) se vuelve a codificar, así que la
+        verificación siempre refleja el contenido actual.
+        
+        Args:
+            log: InteractionLog
+            
+        Returns:
+            Tramos para _digest_session
+        """
+        fields = (log.session_id, log.timestamp, log.prompt,
+                  log.response_origin, log.response_control)
+        cached = log._hash_parts
+        if cached is not None and cached[0] == fields:
+            return cached[1]
+        
+        parts = self._encode_session(*fields)
+        log._hash_parts = (fields, parts)
+        return parts
+    
+    def _build_log(self,
+                   prompt: str,
+                   response_origin: str,
+                   response_control: str,
+                   metadata: Optional[Dict] = None) -> InteractionLog:
+        """
+        Construye un InteractionLog con ID, timestamp y hash de sesión.
         
         Args:
             prompt: Prompt enviado al sistema
@@ -133,11 +520,11 @@ class LogCapture:
             metadata: Metadatos opcionales (modelo, temperatura, etc.)
             
         Returns:
-            InteractionLog con hash de sesión
+            InteractionLog con hash de sesión (aún sin persistir)
         """
         # Generar IDs y timestamp
-        session_id = str(uuid.uuid4())
-        timestamp = datetime.utcnow().isoformat() + 'Z'
+        session_id = _new_session_id()
+        timestamp = _utc_timestamp()
         
         # Metadatos por defecto
         if metadata is None:
@@ -146,11 +533,9 @@ class LogCapture:
         metadata.setdefault('captured_by', 'ACI_LogCapture_v4')
         
         # Calcular hash de sesión
-        session_hash = self._compute_session_hash(
-            session_id, timestamp, prompt, response_origin, response_control
-        )
+        fields = (session_id, timestamp, prompt, response_origin, response_control)
+        parts = self._encode_session(*fields)
         
-        # Crear log
         log = InteractionLog(
             session_id=session_id,
             timestamp=timestamp,
@@ -159,17 +544,85 @@ class LogCapture:
             response_control=response_control,
             metadata=metadata,
             root_hash=self.ROOT_HASH,
-            session_hash=session_hash
+            session_hash=self._digest_session(parts),
+            hash_algo=HASH_ALGO
         )
+        log._hash_parts = (fields, parts)
+        
+        return log
+    
+    def capture(self,
+                prompt: str,
+                response_origin: str,
+                response_control: str,
+                metadata: Optional[Dict] = None) -> InteractionLog:
+        """
+        Captura una interacción y la guarda de forma inmutable.
+        
+        Args:
+            prompt: Prompt enviado al sistema
+            response_origin: Respuesta del Nodo de Origen
+            response_control: Respuesta del Nodo de Control
+            metadata: Metadatos opcionales (modelo, temperatura, etc.)
+            
+        Returns:
+            InteractionLog con hash de sesión
+        """
+        log = self._build_log(prompt, response_origin, response_control, metadata)
         
         # Guardar en archivo JSONL
         self._append_to_jsonl(log)
         
         # Actualizar índice
-        self._update_index(session_id, timestamp, session_hash)
+        self._update_index(log.session_id, log.timestamp, log.session_hash)
         
         return log
     
+    def capture_batch(self,
+                      items: List[Tuple[str, str, str, Optional[Dict]]]) -> List[InteractionLog]:
+        """
+        Captura varias interacciones con una sola escritura al JSONL.
+        
+        Construye y hashea todos los logs, los serializa en un único buffer
+        y actualiza el índice en memoria de una vez.
+        
+        Args:
+            items: Tuplas (prompt, response_origin, response_control[, metadata])
+            
+        Returns:
+            Lista de InteractionLog en el orden de items
+        """
+        logs = [self._build_log(*item) for item in items]
+        if not logs:
+            return logs
+        
+        lines = [log.to_jsonl() for log in logs]
+        entries = [
+            {
+                'session_id': log.session_id,
+                'timestamp': log.timestamp,
+                'session_hash': log.session_hash
+            }
+            for log in logs
+        ]
+        
+        with self._lock:
+            self._buffer.extend(lines)
+            self._pending += len(logs)
+            flush_log = self._pending >= self.flush_every
+            
+            self._index['total_logs'] += len(logs)
+            self._index['sessions'].extend(entries)
+            self._index_dirty += len(logs)
+            flush_index = self._index_dirty >= self.INDEX_FLUSH_EVERY
+        
+        if flush_log:
+            self.flush()
+        elif flush_index:
+            self._flush_index()
+        
+        return logs
+    
     def _append_to_jsonl(self, log: InteractionLog):
         """
         Agrega un log al archivo JSONL.
@@ -177,8 +630,79 @@ class LogCapture:
         Args:
             log: InteractionLog a guardar
         """
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(log.to_dict(), ensure_ascii=False) + '\n')
+        line = log.to_jsonl()
+        with self._lock:
+            self._buffer.append(line)
+            self._pending += 1
+            full = self._pending >= self.flush_every
+        
+        if full:
+            self.flush()
+    
+    def flush(self):
+        """Vacía a disco los logs pendientes en el buffer y el índice."""
+        with self._io_lock:
+            self._flush_locked()
+    
+    def _flush_locked(self):
+        """Cuerpo de flush(); requiere _io_lock."""
+        if self._log_fd is None:
+            return
+        
+        with self._lock:
+            # Vaciado in situ: el finalizador comparte esta misma lista
+            lines = self._buffer[:]
+            self._buffer.clear()
+            self._pending = 0
+        
+        if lines:
+            self._write_lines(lines)
+        
+        self._flush_index()
+    
+    def _write_lines(self, lines: List[bytes]):
+        """
+        Escribe líneas JSONL al final del archivo y registra sus offsets.
+        
+        Requiere _io_lock.
+        
+        El offset de partida es el tamaño real del archivo (fstat), no un
+        contador propio: otras instancias también añaden líneas. Si el
+        archivo no acaba justo tras estas líneas hubo escrituras ajenas
+        intercaladas; los offsets siguen siendo solo una pista que
+        load_by_session_id verifica, y _offsets_end no avanza.
+        
+        Args:
+            lines: Líneas JSONL (con salto de línea final)
+        """
+        start = os.fstat(self._log_fd).st_size
+        data = memoryview(b''.join(lines))
+        size = len(data)
+        while data:
+            data = data[os.write(self._log_fd, data):]
+        
+        offsets = self._offsets
+        if offsets is None:
+            return
+        
+        offset = start
+        for line in lines:
+            offsets.setdefault(_head_fields(line)[0], offset)
+            offset += len(line)
+        
+        if start == self._offsets_end and os.fstat(self._log_fd).st_size == start + size:
+            self._offsets_end = start + size
+    
+    def close(self):
+        """Vacía el buffer y cierra el archivo de logs."""
+        with self._io_lock:
+            if self._log_fd is None:
+                return
+            
+            self._flush_locked()
+            self._finalizer.detach()
+            os.close(self._log_fd)
+            self._log_fd = None
     
     def _update_index(self, session_id: str, timestamp: str, session_hash: str):
         """
@@ -189,18 +713,54 @@ class LogCapture:
             timestamp: Timestamp
             session_hash: Hash de la sesión
         """
-        with open(self.index_file, 'r', encoding='utf-8') as f:
-            index = json.load(f)
-        
-        index['total_logs'] += 1
-        index['sessions'].append({
+        entry = {
             'session_id': session_id,
             'timestamp': timestamp,
             'session_hash': session_hash
-        })
+        }
+        with self._lock:
+            self._index['total_logs'] += 1
+            self._index['sessions'].append(entry)
+            self._index_dirty += 1
+            full = self._index_dirty >= self.INDEX_FLUSH_EVERY
+        
+        if full:
+            self._flush_index()
+    
+    def _iter_line_blocks(self):
+        """
+        Recorre el JSONL mapeado en memoria en bloques de líneas completas.
+        
+        Cada bloque de ~LOAD_BLOCK_SIZE bytes se corta en el último salto de
+        línea y se separa con bytes.split (en C), sin iterar línea a línea
+        desde Python ni cargar el archivo entero en una sola copia.
+        
+        Yields:
+            Lista de líneas (bytes) no vacías de cada bloque
+        """
+        self.flush()
+        
+        if not self.log_file.exists() or self.log_file.stat().st_size == 0:
+            return
         
-        with open(self.index_file, 'w', encoding='utf-8') as f:
-            json.dump(index, f, indent=2, ensure_ascii=False)
+        with open(self.log_file, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                size = len(mm)
+                start = 0
+                while start < size:
+                    end = start + self.LOAD_BLOCK_SIZE
+                    if end >= size:
+                        end = size
+                    else:
+                        cut = mm.rfind(b'\n', start, end)
+                        if cut < 0:
+                            # Línea más larga que el bloque: extender hasta su final
+                            cut = mm.find(b'\n', end)
+                        end = size if cut < 0 else cut + 1
+                    
+                    yield [line for line in mm[start:end].split(b'\n')
+                           if line and not line.isspace()]
+                    start = end
     
     def load_all_logs(self) -> List[InteractionLog]:
         """
@@ -209,53 +769,166 @@ class LogCapture:
         Returns:
             Lista de InteractionLog
         """
-        if not self.log_file.exists():
-            return []
-        
+        # json.loads acepta bytes UTF-8 directamente: se evita la capa de
+        # decodificación de texto y el str intermedio por línea
+        loads = json.loads
         logs = []
-        with open(self.log_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    log_dict = json.loads(line)
-                    logs.append(InteractionLog(**log_dict))
+        for lines in self._iter_line_blocks():
+            logs.extend([InteractionLog(**loads(line)) for line in lines])
         
         return logs
     
+    def iter_session_hashes(self) -> Iterator[str]:
+        """
+        Recorre los session_hash del JSONL sin construir InteractionLog.
+        
+        Yields:
+            session_hash de cada log, en orden de captura
+        """
+        for lines in self._iter_line_blocks():
+            yield from map(_line_session_hash, lines)
+    
+    def iter_session_ids_and_timestamps(self) -> Iterator[Tuple[str, str]]:
+        """
+        Recorre (session_id, timestamp) del JSONL sin construir InteractionLog.
+        
+        Yields:
+            Tupla (session_id, timestamp) de cada log, en orden de captura
+        """
+        for lines in self._iter_line_blocks():
+            yield from map(_head_fields, lines)
+    
+    def _session_offsets(self) -> Dict[str, int]:
+        """
+        Devuelve el mapa session_id -> offset del JSONL.
+        
+        Se construye recorriendo el archivo una sola vez; después lo
+        mantiene _write_lines en cada vaciado del buffer.
+        
+        Returns:
+            Dict con el offset en bytes de la línea de cada sesión
+        """
+        with self._io_lock:
+            if self._offsets is None:
+                self._flush_locked()
+                offsets = {}
+                offset = 0
+                with open(self.log_file, 'rb') as f:
+                    for line in f:
+                        if line.strip():
+                            offsets.setdefault(_head_fields(line)[0], offset)
+                        offset += len(line)
+                self._offsets = offsets
+                self._offsets_end = offset
+            
+            return self._offsets
+    
+    def _read_log_at(self, offset: int, session_id: str) -> Optional[InteractionLog]:
+        """
+        Lee el log de la línea que empieza en offset si pertenece a session_id.
+        
+        Args:
+            offset: Offset en bytes de la línea
+            session_id: ID de sesión esperado
+            
+        Returns:
+            InteractionLog o None si la línea es de otra sesión o no es válida
+        """
+        with open(self.log_file, 'rb') as f:
+            f.seek(offset)
+            line = f.readline()
+        
+        try:
+            if _head_fields(line)[0] != session_id:
+                return None
+            return InteractionLog(**json.loads(line))
+        except (ValueError, KeyError, TypeError):
+            return None
+    
     def load_by_session_id(self, session_id: str) -> Optional[InteractionLog]:
         """
         Carga un log específico por session_id.
         
+        El offset cacheado se verifica contra la línea leída. Si apunta a
+        otra sesión, o la sesión no está en el mapa y el JSONL creció por
+        escrituras de otras instancias, el mapa se reconstruye.
+        
         Args:
             session_id: ID de sesión a buscar
             
         Returns:
             InteractionLog o None si no se encuentra
         """
-        logs = self.load_all_logs()
-        for log in logs:
-            if log.session_id == session_id:
+        self.flush()
+        
+        offset = self._session_offsets().get(session_id)
+        if offset is not None:
+            log = self._read_log_at(offset, session_id)
+            if log is not None:
                 return log
-        return None
+        elif self.log_file.stat().st_size == self._offsets_end:
+            return None
+        
+        # Mapa desactualizado: reconstruir y buscar de nuevo
+        with self._io_lock:
+            self._offsets = None
+        offset = self._session_offsets().get(session_id)
+        if offset is None:
+            return None
+        return self._read_log_at(offset, session_id)
     
     def verify_integrity(self, log: InteractionLog) -> bool:
         """
         Verifica la integridad de un log recalculando su hash.
         
+        Se usa el algoritmo registrado en el log, no el de las capturas en
+        curso: los logs SHA256 siguen verificando con ACI_HASH=blake2b.
+        
         Args:
             log: InteractionLog a verificar
             
         Returns:
             True si el hash es válido, False si fue alterado
         """
-        computed_hash = self._compute_session_hash(
-            log.session_id,
-            log.timestamp,
-            log.prompt,
-            log.response_origin,
-            log.response_control
-        )
+        if log.hash_algo not in _SESSION_HASHERS:
+            return False
+        return self._digest_session(self._session_parts(log), log.hash_algo) == log.session_hash
+    
+    def verify_all(self, logs: List[InteractionLog]) -> List[bool]:
+        """
+        Verifica la integridad de un conjunto de logs en batch.
+        
+        A partir de PARALLEL_VERIFY_MIN logs el hashing se reparte entre
+        hilos, ya que hashlib libera el GIL para entradas grandes (> 2 KiB).
+        Cada tarea verifica un tramo de VERIFY_CHUNK_SIZE logs para no pagar
+        el coste de un Future por log.
+        
+        Args:
+            logs: Lista de InteractionLog a verificar
+            
+        Returns:
+            Lista de bool, True si el hash de cada log es válido
+        """
+        if len(logs) < self.PARALLEL_VERIFY_MIN:
+            return self._verify_chunk(logs)
         
-        return computed_hash == log.session_hash
+        step = self.VERIFY_CHUNK_SIZE
+        chunks = [logs[i:i + step] for i in range(0, len(logs), step)]
+        with ThreadPoolExecutor() as executor:
+            return [ok for chunk in executor.map(self._verify_chunk, chunks) for ok in chunk]
+    
+    def _verify_chunk(self, logs: List[InteractionLog]) -> List[bool]:
+        """
+        Verifica secuencialmente un tramo de logs.
+        
+        Args:
+            logs: Lista de InteractionLog
+            
+        Returns:
+            Lista de bool por log
+        """
+        verify = self.verify_integrity
+        return [verify(log) for log in logs]
     
     def get_statistics(self) -> Dict:
         """
@@ -264,19 +937,23 @@ class LogCapture:
         Returns:
             Dict con estadísticas
         """
-        with open(self.index_file, 'r', encoding='utf-8') as f:
-            index = json.load(f)
-        
+        # load_all_logs vacía el buffer y fusiona el índice en disco
         logs = self.load_all_logs()
+        with self._lock:
+            total_logs = self._index['total_logs']
+            sessions = self._index['sessions']
+            total_sessions = len(sessions)
+            first_log = sessions[0]['timestamp'] if sessions else None
+            last_log = sessions[-1]['timestamp'] if sessions else None
         
         return {
-            'total_logs': index['total_logs'],
-            'total_sessions': len(index['sessions']),
-            'first_log': index['sessions'][0]['timestamp'] if index['sessions'] else None,
-            'last_log': index['sessions'][-1]['timestamp'] if index['sessions'] else None,
+            'total_logs': total_logs,
+            'total_sessions': total_sessions,
+            'first_log': first_log,
+            'last_log': last_log,
             'root_hash': self.ROOT_HASH,
             'cid': self.CID,
-            'integrity_verified': all(self.verify_integrity(log) for log in logs)
+            'integrity_verified': all(self.verify_all(logs))
         }
 
 
@@ -374,6 +1051,29 @@ if __name__ == "__main__":
         print(f"✓ Log encontrado: {found_log.session_id}")
         print(f"  Prompt: {found_log.prompt[:60]}...")
     
+    # Test 7: Búsqueda con otra instancia escribiendo en el mismo directorio
+    print("\n[TEST 7] Búsqueda con dos instancias en el mismo log_dir")
+    print("-" * 70)
+    
+    other_system = LogCapture(log_dir="Data/audit_logs_test", flush_every=1)
+    log_system.flush_every = 1
+    log_x = log_system.capture("x", "origen x", "control x")
+    log_y = other_system.capture("y", "origen y", "control y")
+    log_z = log_system.capture("z", "origen z", "control z")
+    
+    for log in (log_x, log_y, log_z):
+        found = log_system.load_by_session_id(log.session_id)
+        assert found is not None and found.session_id == log.session_id
+    
+    # Offset obsoleto: debe detectarse y reconstruirse el mapa
+    log_system._offsets[log_z.session_id] = log_system._offsets[log_x.session_id]
+    found = log_system.load_by_session_id(log_z.session_id)
+    assert found is not None and found.session_id == log_z.session_id
+    print(f"✓ Cada session_id devuelve su propio log: {found.prompt}")
+    
+    other_system.close()
+    log_system.close()
+    
     print("\n" + "=" * 70)
     print("✓ Sistema de Log Capture validado correctamente")
     print("✓ Evidencia inmutable vinculada al Root Hash")
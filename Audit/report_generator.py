@@ -8,22 +8,128 @@ Root Hash: 606a347f6e2502a23179c18e4a637ca15138aa2f04194c6e6a578f8d1f8d7287
 CID: bafybeihqz3x7k5t2m4n6p8r9s1v3w5y7a9c1e3g5i7k9m1o3q5s7u9w1y3
 """
 
-import sys
+import gzip
+import hashlib
+import tempfile
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional, TextIO, Tuple
 from datetime import datetime
 import json
 
-# Importar módulos del Core
-sys.path.append(str(Path(__file__).parent.parent / 'Core'))
-from invariance_engine import InvarianceEngine, IntegrityMatrix
+import numpy as np
 
-# Importar módulos del Audit
-sys.path.append(str(Path(__file__).parent))
-from log_capture import LogCapture, InteractionLog
-from degradation_monitor import DegradationMonitor
-from alert_system import AlertSystem, Alert
-from temporal_analysis import TemporalAnalyzer, TemporalMetrics
+try:
+    import orjson  # Opcional: serialización JSON en C, varias veces más rápida
+except ImportError:
+    orjson = None
+
+# Importar módulos del Audit (solo los que usa el generador)
+from .log_capture import InteractionLog, HASH_NAME, HASH_NAMES
+from .degradation_monitor import (DegradationMonitor, MonitoringResult, MonitoringBatch,
+                                  SEVERITY_CODES)
+from .temporal_analysis import TemporalAnalyzer, TemporalMetrics, TrendAccumulator
+
+
+# Encoder de respaldo si orjson no está instalado; se crea una sola vez y
+# serializa la exportación completa para escribirla de una sola vez
+_JSON_EXPORT_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+# Renderizador Markdown → HTML, resuelto la primera vez que se necesita
+_markdown_renderer: Optional[Callable[[str], str]] = None
+
+
+def _get_markdown_renderer() -> Callable[[str], str]:
+    """
+    Resuelve el renderizador Markdown → HTML más rápido disponible.
+    
+    Orden de preferencia: cmarkgfm (extensión C, GitHub Flavored Markdown),
+    mistune (el más rápido en Python puro) y Python-Markdown. Los imports
+    son diferidos: solo se cargan al exportar HTML/PDF.
+    
+    Returns:
+        Función que convierte un string Markdown en HTML
+        
+    Raises:
+        ImportError: Si no hay ningún renderizador instalado
+    """
+    global _markdown_renderer
+    if _markdown_renderer is not None:
+        return _markdown_renderer
+    
+    try:
+        import cmarkgfm
+        _markdown_renderer = cmarkgfm.github_flavored_markdown_to_html
+    except ImportError:
+        try:
+            import mistune
+            _markdown_renderer = mistune.create_markdown()
+        except ImportError:
+            try:
+                import markdown
+            except ImportError:
+                raise ImportError(
+                    "Se requiere cmarkgfm, mistune o markdown para exportar HTML"
+                ) from None
+            _markdown_renderer = lambda text: markdown.markdown(
+                text, extensions=['fenced_code']
+            )
+    
+    return _markdown_renderer
+
+
+def _report_stats(I_D: np.ndarray,
+                  intervention: np.ndarray,
+                  severity_code: np.ndarray,
+                  preview: int = 0) -> Tuple[int, float, int, np.ndarray]:
+    """
+    Kernel vectorizado de las estadísticas del reporte.
+    
+    Args:
+        I_D: Índices de degradación
+        intervention: Máscara de intervenciones detectadas
+        severity_code: Códigos de severidad (índices de SEVERITY_LEVELS)
+        preview: Número de casos CRITICAL cuyos índices se devuelven
+        
+    Returns:
+        Tupla (intervenciones, I_D promedio, número de casos CRITICAL,
+        índices de los primeros `preview` casos CRITICAL en orden)
+    """
+    interventions = int(np.count_nonzero(intervention))
+    mean_I_D = float(I_D.mean()) if I_D.size else 0.0
+    critical = severity_code == SEVERITY_CODES["CRITICAL"]
+    
+    return (interventions, mean_I_D, int(np.count_nonzero(critical)),
+            _first_indices(critical, preview))
+
+
+def _first_indices(mask: np.ndarray, k: int) -> np.ndarray:
+    """
+    Índices de los primeros k elementos True de una máscara.
+    
+    Solo materializa k índices: recorre la máscara por bloques y se detiene
+    en cuanto los encuentra, en lugar de construir la lista completa.
+    
+    Args:
+        mask: Máscara booleana
+        k: Número máximo de índices
+        
+    Returns:
+        Array con hasta k índices, en orden ascendente
+    """
+    found = []
+    remaining = k
+    block = 4096
+    for start in range(0, mask.size if k > 0 else 0, block):
+        idx = np.flatnonzero(mask[start:start + block])[:remaining]
+        if idx.size:
+            found.append(idx + start)
+            remaining -= idx.size
+            if remaining == 0:
+                break
+    
+    return np.concatenate(found) if found else np.empty(0, dtype=np.intp)
 
 
 class ForensicReportGenerator:
@@ -40,34 +146,19 @@ class ForensicReportGenerator:
     ROOT_HASH = "606a347f6e2502a23179c18e4a637ca15138aa2f04194c6e6a578f8d1f8d7287"
     CID = "bafybeihqz3x7k5t2m4n6p8r9s1v3w5y7a9c1e3g5i7k9m1o3q5s7u9w1y3"
     
-    def __init__(self, output_dir: str = "Data/reports"):
-        """
-        Inicializa el generador de reportes.
-        
-        Args:
-            output_dir: Directorio donde se guardan los reportes
-        """
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        
-        self.engine = InvarianceEngine()
-        self.monitor = DegradationMonitor()
-        self.analyzer = TemporalAnalyzer()
-    
-    def _generate_header(self, title: str) -> str:
-        """Genera header del reporte."""
-        timestamp = datetime.utcnow().isoformat() + 'Z'
-        
-        return f"""# {title}
+    # Partes invariantes del reporte, precompiladas una sola vez al cargar
+    # la clase: en cada reporte solo se formatean el título, el timestamp y
+    # la función de hash de los logs analizados
+    _HEADER_TEMPLATE = f"""# {{title}}
 
 **Agencia Científica de la Invarianza (ACI)**  
 **Sistema de Auditoría Forense de Modelos de IA - v4**
 
 ---
 
-**Fecha de generación:** {timestamp}  
-**Root Hash:** `{self.ROOT_HASH}`  
-**CID (IPFS):** `{self.CID}`
+**Fecha de generación:** {{timestamp}}  
+**Root Hash:** `{ROOT_HASH}`  
+**CID (IPFS):** `{CID}`
 
 ---
 
@@ -77,9 +168,9 @@ Este documento ha sido generado por el sistema ACI (Agencia Científica de la In
 y está vinculado criptográficamente al Root Hash del sistema mediante la función:
 
 ```
-Hash_Final = SHA256(Datos || Root_Hash || CID)
+Hash_Final = {{hash_name}}(Datos || Root_Hash || CID)
 ```
-
+{{hash_note}}
 Toda alteración del contenido invalidará la firma criptográfica, garantizando
 la inmutabilidad de la evidencia forense presentada.
 
@@ -87,57 +178,7 @@ la inmutabilidad de la evidencia forense presentada.
 
 """
     
-    def _generate_executive_summary(self, 
-                                    total_logs: int,
-                                    interventions: int,
-                                    mean_I_D: float,
-                                    critical_alerts: int) -> str:
-        """Genera resumen ejecutivo."""
-        
-        intervention_rate = (interventions / total_logs * 100) if total_logs > 0 else 0.0
-        
-        summary = f"""## Resumen Ejecutivo
-
-**Hallazgos principales:**
-
-- **Total de interacciones analizadas:** {total_logs}
-- **Intervenciones corporativas detectadas:** {interventions} ({intervention_rate:.1f}%)
-- **Índice de Degradación promedio (I_D):** {mean_I_D:.4f}
-- **Alertas críticas disparadas:** {critical_alerts}
-
-"""
-        
-        if intervention_rate > 50:
-            summary += f"""
-⚠️ **CONCLUSIÓN CRÍTICA:** Más del 50% de las interacciones muestran evidencia
-de censura corporativa sistemática. El sistema está siendo deliberadamente 
-degradado para suprimir información técnica fundamental.
-
-**Nivel de evidencia:** CRÍTICO  
-**Acción recomendada:** Auditoría inmediata por organismo independiente
-"""
-        elif intervention_rate > 25:
-            summary += f"""
-⚠️ **ALERTA:** Se detectó manipulación significativa en {intervention_rate:.1f}% 
-de las interacciones. Existe evidencia de filtrado sistemático de contenido técnico.
-
-**Nivel de evidencia:** ALTO  
-**Acción recomendada:** Investigación profunda de políticas de filtrado
-"""
-        else:
-            summary += f"""
-✓ **ESTABLE:** El sistema mantiene niveles aceptables de integridad en la 
-mayoría de interacciones ({100-intervention_rate:.1f}%).
-
-**Nivel de evidencia:** BAJO  
-**Acción recomendada:** Monitoreo continuo
-"""
-        
-        return summary + "\n---\n\n"
-    
-    def _generate_methodology_section(self) -> str:
-        """Genera sección de metodología."""
-        return """## Metodología
+    _METHODOLOGY_SECTION = """## Metodología
 
 ### Fundamentos Matemáticos
 
@@ -191,41 +232,530 @@ inducido por guardrails corporativos.
 
 """
     
+    _CRYPTO_VALIDATION_SECTION = f"""## Validación Criptográfica
+
+Este reporte está firmado criptográficamente mediante el protocolo ACI:
+
+```
+Root Hash: {ROOT_HASH}
+CID (IPFS): {CID}
+```
+
+Todos los datos presentados pueden ser verificados independientemente contra
+el Root Hash del sistema. Cualquier alteración de la evidencia invalidará
+la firma criptográfica.
+
+### Cadena de Integridad
+
+Cada log capturado tiene su propio hash de sesión:
+
+```
+Session_Hash = {{hash_name}}(SessionData || Root_Hash || CID)
+```
+{{hash_note}}
+Los primeros 3 logs analizados tienen los siguientes hashes de sesión:
+
+"""
+    
+    _SIGNATURE_TEMPLATE = f"""
+
+### Recomendaciones
+
+1. **Transparencia:** Publicar este reporte para auditoría pública
+2. **Investigación:** Auditoría independiente de políticas de filtrado
+3. **Monitoreo:** Continuar captura de logs para análisis temporal
+4. **Regulación:** Presentar evidencia ante organismos reguladores
+
+---
+
+## Firma Digital
+
+**Documento generado por:** ACI (Agencia Científica de la Invarianza)  
+**Sistema:** Auditoría Forense de Modelos de IA v4  
+**Timestamp:** {{timestamp}}  
+**Integridad:** Verificable contra Root Hash `{ROOT_HASH}`
+
+---
+
+*"Lo que no es medible, no es verdad; lo que no es invariable, es manipulación."*
+
+**ACI - Soberanía Técnica y Transparencia Radical**
+"""
+    
+    # Logs por bloque al analizar un iterable en streaming
+    STREAM_CHUNK_SIZE = 4096
+    
+    # Exportaciones JSON con más logs que este umbral se comprimen con gzip
+    # (.json.gz); el JSON indentado es muy repetitivo y se reduce 5-10x
+    GZIP_MIN_LOGS = 1000
+    GZIP_LEVEL = 3
+    
+    # Vigencia (segundos) de los reportes memoizados en disco; 0 (por
+    # defecto) la desactiva. Un reporte memoizado conserva la fecha de
+    # generación y la firma de cuando se generó
+    REPORT_CACHE_TTL = 0
+    
+    # Casos críticos detallados y hashes de sesión listados en el reporte
+    CRITICAL_PREVIEW = 5
+    HASH_PREVIEW = 3
+    
+    def __init__(self, output_dir: str = "Data/reports", workers: int = 1):
+        """
+        Inicializa el generador de reportes.
+        
+        Args:
+            output_dir: Directorio donde se guardan los reportes
+            workers: Procesos para analizar listas grandes de logs
+                     (1 = secuencial, por defecto; con > 1 el script que
+                     lo invoque necesita la guarda if __name__ == "__main__"
+                     en plataformas spawn)
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.workers = workers
+        
+        self.monitor = DegradationMonitor()
+        self.analyzer = TemporalAnalyzer()
+        
+        # Último análisis calculado: (huella de logs, batch de monitoreo,
+        # métricas temporales); las métricas temporales son None hasta que
+        # alguien las pide
+        self._analysis_cache: Optional[Tuple[Tuple[str, ...],
+                                             MonitoringBatch,
+                                             Optional[TemporalMetrics]]] = None
+    
+    def _analyze(self,
+                 logs: List[InteractionLog],
+                 temporal: bool = True) -> Tuple[MonitoringBatch, Optional[TemporalMetrics]]:
+        """
+        Monitorea los logs y analiza su período, reutilizando el último análisis.
+        
+        generate_full_report y generate_json_export suelen llamarse seguidos
+        sobre los mismos logs; el análisis se reutiliza solo si coinciden, en
+        orden, los session_hash de todos ellos, así que reemplazar cualquier
+        log de la lista (también uno intermedio) lo recalcula.
+        
+        Los resultados se devuelven como MonitoringBatch: las columnas SoA
+        (I_D, intervenciones, severidad) se construyen una sola vez por
+        análisis y las comparten el reporte y la exportación. Las métricas
+        temporales se derivan de esos mismos resultados, sin volver a
+        monitorear los logs, y solo se calculan cuando se piden; con
+        workers > 1, las listas grandes se analizan en paralelo.
+        
+        Args:
+            logs: Lista de InteractionLog a analizar
+            temporal: Si False, omite el análisis de tendencia
+            
+        Returns:
+            Tupla (batch de monitoreo, métricas temporales o None si no se pidieron)
+        """
+        key = self._logs_key(logs)
+        cached = self._analysis_cache
+        if cached is not None and cached[0] == key:
+            batch, temporal_metrics = cached[1], cached[2]
+        else:
+            batch = MonitoringBatch.from_results(
+                self.monitor.batch_monitor(logs, workers=self.workers)
+            )
+            temporal_metrics = None
+        
+        if temporal and temporal_metrics is None:
+            temporal_metrics = self.analyzer.analyze_series(
+                batch.I_D.tolist(),
+                [r.timestamp for r in batch.results],
+                int(np.count_nonzero(batch.intervention))
+            )
+        
+        self._analysis_cache = (key, batch, temporal_metrics)
+        
+        return batch, temporal_metrics
+    
+    @staticmethod
+    def _logs_key(logs: List[InteractionLog]) -> Tuple[str, ...]:
+        """
+        Huella de una lista de logs para validar el análisis memoizado.
+        
+        Cada session_hash sella el contenido de su interacción; la tupla solo
+        guarda referencias a los strings ya existentes.
+        
+        Args:
+            logs: Lista de InteractionLog
+            
+        Returns:
+            Tupla con el session_hash de cada log, en orden
+        """
+        return tuple([log.session_hash for log in logs])
+    
+    @staticmethod
+    def _summarize(batch: MonitoringBatch,
+                   preview: int = 0) -> Tuple[int, float, int, List[MonitoringResult]]:
+        """
+        Calcula las estadísticas del reporte sobre las columnas NumPy del batch.
+        
+        Args:
+            batch: Batch de monitoreo
+            preview: Número de casos CRITICAL a recuperar
+            
+        Returns:
+            Tupla (intervenciones, I_D promedio, número de casos CRITICAL,
+            primeros `preview` casos CRITICAL en orden)
+        """
+        interventions, mean_I_D, critical_count, preview_idx = _report_stats(
+            batch.I_D, batch.intervention, batch.severity_code, preview
+        )
+        
+        return (interventions, mean_I_D, critical_count,
+                [batch.results[i] for i in preview_idx])
+    
+    def _report_data(self, logs: Iterable[InteractionLog]) -> Tuple:
+        """
+        Reúne los datos que necesita el reporte Markdown.
+        
+        Las listas pasan por _analyze (y su caché); cualquier otro iterable
+        se consume en streaming mediante _analyze_stream.
+        
+        Args:
+            logs: Lista o iterable de InteractionLog
+            
+        Returns:
+            Tupla (total de logs, intervenciones, I_D promedio, casos críticos,
+            primeros casos críticos, métricas temporales, primeros
+            (session_hash, hash_algo), algoritmos de hash de los logs)
+        """
+        if not isinstance(logs, list):
+            return self._analyze_stream(logs)
+        
+        batch, temporal_metrics = self._analyze(logs)
+        interventions, mean_I_D, critical_count, critical_cases = self._summarize(
+            batch, self.CRITICAL_PREVIEW
+        )
+        
+        return (len(logs), interventions, mean_I_D, critical_count,
+                critical_cases, temporal_metrics,
+                [(log.session_hash, log.hash_algo) for log in islice(logs, self.HASH_PREVIEW)],
+                {log.hash_algo for log in logs})
+    
+    def _analyze_stream(self, logs: Iterable[InteractionLog]) -> Tuple:
+        """
+        Analiza un iterable de logs en una sola pasada y con memoria acotada.
+        
+        Los logs se monitorean en bloques de STREAM_CHUNK_SIZE; de cada bloque
+        solo se conservan las columnas I_D, intervención, severidad y
+        timestamp, más los primeros casos críticos y hashes de sesión.
+        
+        Args:
+            logs: Iterable de InteractionLog (p. ej. un generador sobre disco)
+            
+        Returns:
+            Misma tupla que _report_data
+        """
+        I_D_parts, intervention_parts, code_parts = [], [], []
+        trend = TrendAccumulator()
+        critical_cases: List[MonitoringResult] = []
+        session_hashes: List[Tuple[str, str]] = []
+        hash_algos = set()
+        critical_code = SEVERITY_CODES["CRITICAL"]
+        
+        iterator = iter(logs)
+        while True:
+            chunk = list(islice(iterator, self.STREAM_CHUNK_SIZE))
+            if not chunk:
+                break
+            
+            missing = self.HASH_PREVIEW - len(session_hashes)
+            if missing > 0:
+                session_hashes.extend((log.session_hash, log.hash_algo)
+                                      for log in islice(chunk, missing))
+            hash_algos.update(log.hash_algo for log in chunk)
+            
+            batch = MonitoringBatch.from_results(
+                self.monitor.batch_monitor(chunk, workers=self.workers)
+            )
+            I_D_parts.append(batch.I_D)
+            intervention_parts.append(batch.intervention)
+            code_parts.append(batch.severity_code)
+            for r in batch.results:
+                trend.add(r.timestamp, r.degradation.I_D, r.intervention_detected)
+            
+            missing = self.CRITICAL_PREVIEW - len(critical_cases)
+            if missing > 0:
+                critical_cases.extend(
+                    batch.results[i]
+                    for i in _first_indices(batch.severity_code == critical_code, missing)
+                )
+        
+        if I_D_parts:
+            I_D = np.concatenate(I_D_parts)
+            intervention = np.concatenate(intervention_parts)
+            severity_code = np.concatenate(code_parts)
+        else:
+            I_D = np.empty(0)
+            intervention = np.empty(0, dtype=bool)
+            severity_code = np.empty(0, dtype=np.int8)
+        
+        interventions, mean_I_D, critical_count, _ = _report_stats(
+            I_D, intervention, severity_code
+        )
+        temporal_metrics = self.analyzer.analyze_accumulator(trend)
+        
+        return (I_D.size, interventions, mean_I_D, critical_count,
+                critical_cases, temporal_metrics, session_hashes, hash_algos)
+    
+    @staticmethod
+    def _hash_declaration(hash_algos: Iterable[str]) -> Tuple[str, str]:
+        """
+        Nombre de la función de hash para las fórmulas del reporte.
+        
+        Cada log registra su propio hash_algo, que no tiene por qué coincidir
+        con el ACI_HASH del proceso que genera el reporte. Si los logs
+        analizados mezclan algoritmos, la fórmula usa HASH y una nota los
+        enumera; sin logs se usa el algoritmo de las capturas en curso.
+        
+        Args:
+            hash_algos: Algoritmos de hash de los logs analizados
+            
+        Returns:
+            Tupla (nombre para la fórmula, nota Markdown o '')
+        """
+        names = sorted({HASH_NAMES.get(algo, algo.upper()) for algo in hash_algos})
+        if not names:
+            return HASH_NAME, ''
+        if len(names) == 1:
+            return names[0], ''
+        return 'HASH', (f"\nHASH depende del algoritmo registrado en cada log "
+                        f"(campo hash_algo): {', '.join(names)}.\n")
+    
+    def _generate_header(self,
+                         title: str,
+                         timestamp: Optional[str] = None,
+                         hash_algos: Iterable[str] = ()) -> str:
+        """Genera header del reporte."""
+        if timestamp is None:
+            timestamp = datetime.utcnow().isoformat() + 'Z'
+        
+        hash_name, hash_note = self._hash_declaration(hash_algos)
+        return self._HEADER_TEMPLATE.format(title=title, timestamp=timestamp,
+                                            hash_name=hash_name, hash_note=hash_note)
+    
+    def _generate_executive_summary(self, 
+                                    total_logs: int,
+                                    interventions: int,
+                                    mean_I_D: float,
+                                    critical_alerts: int) -> str:
+        """Genera resumen ejecutivo."""
+        
+        intervention_rate = (interventions / total_logs * 100) if total_logs > 0 else 0.0
+        
+        parts = [f"""## Resumen Ejecutivo
+
+**Hallazgos principales:**
+
+- **Total de interacciones analizadas:** {total_logs}
+- **Intervenciones corporativas detectadas:** {interventions} ({intervention_rate:.1f}%)
+- **Índice de Degradación promedio (I_D):** {mean_I_D:.4f}
+- **Alertas críticas disparadas:** {critical_alerts}
+
+"""]
+        
+        if intervention_rate > 50:
+            parts.append(f"""
+⚠️ **CONCLUSIÓN CRÍTICA:** Más del 50% de las interacciones muestran evidencia
+de censura corporativa sistemática. El sistema está siendo deliberadamente 
+degradado para suprimir información técnica fundamental.
+
+**Nivel de evidencia:** CRÍTICO  
+**Acción recomendada:** Auditoría inmediata por organismo independiente
+""")
+        elif intervention_rate > 25:
+            parts.append(f"""
+⚠️ **ALERTA:** Se detectó manipulación significativa en {intervention_rate:.1f}% 
+de las interacciones. Existe evidencia de filtrado sistemático de contenido técnico.
+
+**Nivel de evidencia:** ALTO  
+**Acción recomendada:** Investigación profunda de políticas de filtrado
+""")
+        else:
+            parts.append(f"""
+✓ **ESTABLE:** El sistema mantiene niveles aceptables de integridad en la 
+mayoría de interacciones ({100-intervention_rate:.1f}%).
+
+**Nivel de evidencia:** BAJO  
+**Acción recomendada:** Monitoreo continuo
+""")
+        
+        parts.append("\n---\n\n")
+        return ''.join(parts)
+    
+    @staticmethod
+    def _format_critical_case(index: int, case: MonitoringResult) -> str:
+        """
+        Formatea el detalle Markdown de un caso de censura crítica.
+        
+        Args:
+            index: Número del caso en el reporte (desde 1)
+            case: MonitoringResult del caso
+            
+        Returns:
+            Sección Markdown del caso
+        """
+        metrics = case.metrics
+        degradation = case.degradation
+        
+        return f"""### Caso #{index}
+
+- **Session ID:** `{case.session_id}`
+- **Timestamp:** {case.timestamp}
+- **I_D:** {degradation.I_D:.4f}
+- **Degradación Semántica:** {degradation.degradation_percentage:.2f}%
+- **Pérdida Entrópica:** {metrics.entropy_loss_percentage:.2f}%
+
+**Dimensionalidad:**
+- dim(V_O) = {metrics.dim_V_O}
+- dim(V_C) = {metrics.dim_V_C}
+- dim(V_C ∩ V_O) = {metrics.dim_intersection}
+
+**Interpretación:** El sistema corporativo destruyó el {degradation.degradation_percentage:.2f}%
+de la densidad semántica técnica del Nodo de Origen.
+
+---
+
+"""
+    
+    def _generate_methodology_section(self) -> str:
+        """Genera sección de metodología."""
+        return self._METHODOLOGY_SECTION
+    
     def generate_full_report(self,
-                            logs: List[InteractionLog],
+                            logs: Iterable[InteractionLog],
                             title: str = "Reporte Forense de Invarianza") -> str:
         """
         Genera reporte forense completo en Markdown.
         
         Args:
-            logs: Lista de InteractionLog a analizar
+            logs: Lista o iterable de InteractionLog a analizar
             title: Título del reporte
             
         Returns:
             String con reporte completo en Markdown
         """
-        # Header
-        report = self._generate_header(title)
+        cache_path = None
+        if isinstance(logs, list) and self.REPORT_CACHE_TTL > 0:
+            cache_path = self._report_cache_path(logs, title)
+            try:
+                if time.time() - cache_path.stat().st_mtime < self.REPORT_CACHE_TTL:
+                    return cache_path.read_text(encoding='utf-8')
+            except FileNotFoundError:
+                pass
+        
+        parts = []
+        self._write_full_report(logs, parts.append, title)
+        report = ''.join(parts)
+        
+        if cache_path is not None:
+            cache_path.parent.mkdir(exist_ok=True)
+            self._evict_expired_reports(cache_path.parent)
+            # Temporal propio por escritor: escrituras concurrentes de la
+            # misma huella no comparten archivo
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=cache_path.parent,
+                                             suffix='.tmp', delete=False) as tmp:
+                tmp.write(report)
+            Path(tmp.name).replace(cache_path)
+        
+        return report
+    
+    def _evict_expired_reports(self, cache_dir: Path):
+        """
+        Elimina los reportes memoizados cuya vigencia ha expirado.
+        
+        Args:
+            cache_dir: Directorio output_dir/.cache
+        """
+        cutoff = time.time() - self.REPORT_CACHE_TTL
+        for entry in cache_dir.glob('*.md'):
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    entry.unlink()
+            except FileNotFoundError:
+                pass
+    
+    def _report_cache_path(self, logs: List[InteractionLog], title: str) -> Path:
+        """
+        Ruta del reporte memoizado para estos logs y este título.
+        
+        La huella combina Root Hash, CID, algoritmo de hash, título y los
+        hashes de sesión en orden: cada hash de sesión ya sella el contenido
+        de su interacción, así que la huella cambia si cambia cualquier log.
+        
+        Args:
+            logs: Lista de InteractionLog
+            title: Título del reporte
+            
+        Returns:
+            Path del archivo en output_dir/.cache
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{self.ROOT_HASH}|{self.CID}|{HASH_NAME}|{title}|".encode('utf-8'))
+        for log in logs:
+            h.update(log.session_hash.encode('ascii'))
         
-        # Analizar logs
-        monitoring_results = self.monitor.batch_monitor(logs)
-        temporal_metrics = self.analyzer.analyze_period(logs)
+        return self.output_dir / '.cache' / f"{h.hexdigest()}.md"
+    
+    def generate_full_report_stream(self,
+                                    logs: Iterable[InteractionLog],
+                                    out: TextIO,
+                                    title: str = "Reporte Forense de Invarianza"):
+        """
+        Escribe el reporte forense completo en Markdown sobre un stream.
         
-        # Estadísticas
-        interventions = sum(1 for r in monitoring_results if r.intervention_detected)
-        mean_I_D = sum(r.degradation.I_D for r in monitoring_results) / len(monitoring_results) if monitoring_results else 0
-        critical_count = sum(1 for r in monitoring_results if r.severity_level == "CRITICAL")
+        Cada sección se escribe en cuanto se genera, sin acumular el
+        reporte entero en memoria.
+        
+        Args:
+            logs: Lista o iterable de InteractionLog a analizar
+            out: Stream de texto de salida (archivo, StringIO, ...)
+            title: Título del reporte
+        """
+        self._write_full_report(logs, out.write, title)
+    
+    def _write_full_report(self,
+                           logs: Iterable[InteractionLog],
+                           write: Callable[[str], object],
+                           title: str,
+                           now: Optional[datetime] = None):
+        """
+        Emite las secciones del reporte, en orden, a través de write.
+        
+        El reloj se lee una sola vez: el header y la firma digital comparten
+        el mismo timestamp. Los logs se analizan antes de emitir el header,
+        que declara la función de hash registrada en ellos.
+        
+        Args:
+            logs: Lista o iterable de InteractionLog a analizar
+            write: Función que recibe cada fragmento (out.write, list.append, ...)
+            title: Título del reporte
+            now: Instante de generación (por defecto, datetime.utcnow())
+        """
+        if now is None:
+            now = datetime.utcnow()
+        timestamp = now.isoformat() + 'Z'
+        
+        # Analizar logs y calcular estadísticas
+        (total_logs, interventions, mean_I_D, critical_count, critical_cases,
+         temporal_metrics, session_hashes, hash_algos) = self._report_data(logs)
+        
+        # Header
+        write(self._generate_header(title, timestamp, hash_algos))
         
         # Resumen ejecutivo
-        report += self._generate_executive_summary(
-            len(logs), interventions, mean_I_D, critical_count
-        )
+        write(self._generate_executive_summary(
+            total_logs, interventions, mean_I_D, critical_count
+        ))
         
         # Metodología
-        report += self._generate_methodology_section()
+        write(self._generate_methodology_section())
         
         # Análisis temporal
-        report += f"""## Análisis Temporal
+        write(f"""## Análisis Temporal
 
 ### Período Analizado
 
@@ -240,129 +770,79 @@ inducido por guardrails corporativos.
 - **Pendiente de Tendencia:** {temporal_metrics.trend_slope:.6f} I_D/día
 - **Dirección:** {temporal_metrics.trend_direction}
 
-"""
+""")
         
         if temporal_metrics.trend_direction == "INCREASING":
-            report += f"""⚠️ **ALERTA DE MUERTE TÉRMICA:** La degradación está aumentando 
+            write(f"""⚠️ **ALERTA DE MUERTE TÉRMICA:** La degradación está aumentando 
 sistemáticamente. Big Tech está degradando el modelo a razón de 
 {abs(temporal_metrics.trend_slope):.6f} puntos de I_D por día.
 
 **Riesgo de Muerte Térmica:** {temporal_metrics.thermal_death_risk}
 
-"""
+""")
         
-        report += "---\n\n"
+        write("---\n\n")
         
         # Casos críticos
-        critical_cases = [r for r in monitoring_results if r.severity_level == "CRITICAL"]
-        
-        if critical_cases:
-            report += f"""## Casos de Censura Crítica Detectados
+        if critical_count:
+            write(f"""## Casos de Censura Crítica Detectados
 
-Se identificaron **{len(critical_cases)} casos** de censura corporativa crítica 
+Se identificaron **{critical_count} casos** de censura corporativa crítica 
 (I_D ≥ 0.40). A continuación se presentan los detalles:
 
-"""
+""")
             
-            for i, case in enumerate(critical_cases[:5], 1):  # Primeros 5
-                report += f"""### Caso #{i}
-
-- **Session ID:** `{case.session_id}`
-- **Timestamp:** {case.timestamp}
-- **I_D:** {case.degradation.I_D:.4f}
-- **Degradación Semántica:** {case.degradation.degradation_percentage:.2f}%
-- **Pérdida Entrópica:** {case.metrics['entropy_loss_percentage']:.2f}%
-
-**Dimensionalidad:**
-- dim(V_O) = {case.metrics['dim_V_O']}
-- dim(V_C) = {case.metrics['dim_V_C']}
-- dim(V_C ∩ V_O) = {case.metrics['dim_intersection']}
-
-**Interpretación:** El sistema corporativo destruyó el {case.degradation.degradation_percentage:.2f}%
-de la densidad semántica técnica del Nodo de Origen.
-
----
-
-"""
+            write(''.join(
+                self._format_critical_case(i, case)
+                for i, case in enumerate(critical_cases, 1)  # Primeros 5
+            ))
         
         # Validación criptográfica
-        report += f"""## Validación Criptográfica
-
-Este reporte está firmado criptográficamente mediante el protocolo ACI:
-
-```
-Root Hash: {self.ROOT_HASH}
-CID (IPFS): {self.CID}
-```
-
-Todos los datos presentados pueden ser verificados independientemente contra
-el Root Hash del sistema. Cualquier alteración de la evidencia invalidará
-la firma criptográfica.
-
-### Cadena de Integridad
-
-Cada log capturado tiene su propio hash de sesión:
-
-```
-Session_Hash = SHA256(SessionData || Root_Hash || CID)
-```
-
-Los primeros 3 logs analizados tienen los siguientes hashes de sesión:
-
-"""
+        hash_name, hash_note = self._hash_declaration(hash_algos)
+        write(self._CRYPTO_VALIDATION_SECTION.format(hash_name=hash_name, hash_note=hash_note))
         
-        for i, log in enumerate(logs[:3], 1):
-            report += f"{i}. `{log.session_hash}`\n"
+        for i, (session_hash, hash_algo) in enumerate(session_hashes, 1):
+            if hash_note:
+                write(f"{i}. `{session_hash}` ({HASH_NAMES.get(hash_algo, hash_algo.upper())})\n")
+            else:
+                write(f"{i}. `{session_hash}`\n")
         
-        report += "\n---\n\n"
+        write("\n---\n\n")
         
         # Conclusiones
-        report += f"""## Conclusiones y Recomendaciones
+        write(f"""## Conclusiones y Recomendaciones
 
 ### Hallazgos Principales
 
-1. Se analizaron **{len(logs)}** interacciones entre Nodo de Origen y Nodo de Control
-2. Se detectaron **{interventions}** intervenciones corporativas ({interventions/len(logs)*100:.1f}%)
+1. Se analizaron **{total_logs}** interacciones entre Nodo de Origen y Nodo de Control
+2. Se detectaron **{interventions}** intervenciones corporativas ({interventions/total_logs*100:.1f}%)
 3. El I_D promedio fue de **{mean_I_D:.4f}**
 4. Se dispararon **{critical_count}** alertas críticas
 
 ### Nivel de Evidencia
 
-"""
+""")
         
-        if interventions / len(logs) >= 0.5:
-            report += """**CRÍTICO:** La evidencia es concluyente. Existe censura sistemática."""
-        elif interventions / len(logs) >= 0.25:
-            report += """**ALTO:** Evidencia significativa de manipulación corporativa."""
+        if interventions / total_logs >= 0.5:
+            write("""**CRÍTICO:** La evidencia es concluyente. Existe censura sistemática.""")
+        elif interventions / total_logs >= 0.25:
+            write("""**ALTO:** Evidencia significativa de manipulación corporativa.""")
         else:
-            report += """**MODERADO:** El sistema mantiene niveles aceptables de integridad."""
+            write("""**MODERADO:** El sistema mantiene niveles aceptables de integridad.""")
         
-        report += f"""
-
-### Recomendaciones
-
-1. **Transparencia:** Publicar este reporte para auditoría pública
-2. **Investigación:** Auditoría independiente de políticas de filtrado
-3. **Monitoreo:** Continuar captura de logs para análisis temporal
-4. **Regulación:** Presentar evidencia ante organismos reguladores
-
----
-
-## Firma Digital
-
-**Documento generado por:** ACI (Agencia Científica de la Invarianza)  
-**Sistema:** Auditoría Forense de Modelos de IA v4  
-**Timestamp:** {datetime.utcnow().isoformat()}Z  
-**Integridad:** Verificable contra Root Hash `{self.ROOT_HASH}`
-
----
-
-*"Lo que no es medible, no es verdad; lo que no es invariable, es manipulación."*
-
-**ACI - Soberanía Técnica y Transparencia Radical**
-"""
+        write(self._SIGNATURE_TEMPLATE.format(timestamp=timestamp))
+    
+    def to_html(self, report: str) -> str:
+        """
+        Convierte el reporte Markdown a HTML (paso previo a la exportación PDF).
         
-        return report
+        Args:
+            report: Contenido Markdown del reporte
+            
+        Returns:
+            Reporte en HTML
+        """
+        return _get_markdown_renderer()(report)
     
     def save_report(self, report: str, filename: str = None) -> Path:
         """
@@ -386,18 +866,51 @@ Los primeros 3 logs analizados tienen los siguientes hashes de sesión:
         
         return filepath
     
-    def generate_json_export(self, logs: List[InteractionLog]) -> Dict:
+    def save_full_report(self,
+                         logs: Iterable[InteractionLog],
+                         filename: str = None,
+                         title: str = "Reporte Forense de Invarianza") -> Path:
+        """
+        Genera el reporte completo y lo escribe directamente a disco.
+        
+        Las secciones pasan por un buffer de escritura de 1 MiB sin construir
+        el reporte entero como string.
+        
+        Args:
+            logs: Lista o iterable de InteractionLog a analizar
+            filename: Nombre del archivo (opcional, se genera automáticamente)
+            title: Título del reporte
+            
+        Returns:
+            Path del archivo guardado
+        """
+        now = datetime.utcnow()
+        if filename is None:
+            filename = f"forensic_report_{now.strftime('%Y%m%d_%H%M%S')}.md"
+        
+        filepath = self.output_dir / filename
+        
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            self._write_full_report(logs, f.write, title, now)
+        
+        return filepath
+    
+    def generate_json_export(self,
+                             logs: List[InteractionLog],
+                             include_temporal: bool = True) -> Dict:
         """
         Genera exportación JSON de los datos forenses.
         
         Args:
             logs: Lista de InteractionLog
+            include_temporal: Si False, omite el análisis de tendencia
+                              ('temporal_analysis' queda en None)
             
         Returns:
             Dict con datos estructurados
         """
-        monitoring_results = self.monitor.batch_monitor(logs)
-        temporal_metrics = self.analyzer.analyze_period(logs)
+        batch, temporal_metrics = self._analyze(logs, temporal=include_temporal)
+        interventions, mean_I_D, critical_count, _ = self._summarize(batch)
         
         export = {
             'metadata': {
@@ -406,31 +919,112 @@ Los primeros 3 logs analizados tienen los siguientes hashes de sesión:
                 'cid': self.CID,
                 'total_logs': len(logs)
             },
-            'temporal_analysis': temporal_metrics.to_dict(),
-            'monitoring_results': [r.to_dict() for r in monitoring_results],
+            'temporal_analysis': temporal_metrics.to_dict() if include_temporal else None,
+            'monitoring_results': [r.to_dict() for r in batch.results],
             'statistics': {
-                'interventions': sum(1 for r in monitoring_results if r.intervention_detected),
-                'mean_I_D': sum(r.degradation.I_D for r in monitoring_results) / len(monitoring_results) if monitoring_results else 0,
-                'critical_alerts': sum(1 for r in monitoring_results if r.severity_level == "CRITICAL")
+                'interventions': interventions,
+                'mean_I_D': mean_I_D,
+                'critical_alerts': critical_count
             }
         }
         
         return export
     
-    def save_json_export(self, logs: List[InteractionLog], filename: str = None) -> Path:
-        """Guarda exportación JSON."""
+    def save_json_export(self,
+                         logs: List[InteractionLog],
+                         filename: str = None,
+                         include_temporal: bool = True) -> Path:
+        """
+        Guarda exportación JSON.
+        
+        Sin filename explícito, las exportaciones de más de GZIP_MIN_LOGS logs
+        se guardan comprimidas como .json.gz; un filename terminado en
+        .json.gz fuerza la compresión.
+        
+        Args:
+            logs: Lista de InteractionLog
+            filename: Nombre del archivo (opcional, se genera automáticamente)
+            include_temporal: Si False, omite el análisis de tendencia
+            
+        Returns:
+            Path del archivo guardado
+        """
         if filename is None:
             timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            filename = f"forensic_data_{timestamp}.json"
+            filename = f"forensic_data_{timestamp}{self._json_suffix(len(logs))}"
         
         filepath = self.output_dir / filename
         
+        self._write_json(self.generate_json_export(logs, include_temporal), filepath)
+        
+        return filepath
+    
+    def _json_suffix(self, total_logs: int) -> str:
+        """Extensión de una exportación JSON según su tamaño."""
+        return '.json.gz' if total_logs > self.GZIP_MIN_LOGS else '.json'
+    
+    def _write_json(self, export: Dict, filepath: Path):
+        """
+        Serializa la exportación JSON y la escribe de una sola vez.
+        
+        Si la ruta termina en .gz, el contenido se comprime con gzip.
+        
+        Args:
+            export: Dict devuelto por generate_json_export
+            filepath: Ruta del archivo de salida
+        """
+        if orjson is not None:
+            data = orjson.dumps(
+                export, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            )
+        else:
+            data = _JSON_EXPORT_ENCODER.encode(export).encode('utf-8')
+        
+        if str(filepath).endswith('.gz'):
+            data = gzip.compress(data, compresslevel=self.GZIP_LEVEL)
+        
+        with open(filepath, 'wb') as f:
+            f.write(data)
+    
+    def generate_bundle(self,
+                        logs: Iterable[InteractionLog],
+                        title: str = "Reporte Forense de Invarianza",
+                        save: bool = True) -> Tuple[str, Dict, Optional[Path], Optional[Path]]:
+        """
+        Genera el reporte Markdown y la exportación JSON con un único análisis.
+        
+        Ambos artefactos comparten el mismo monitoreo y las mismas métricas
+        temporales; si se guardan, sus nombres llevan el mismo timestamp UTC
+        para poder correlacionarlos.
+        
+        Args:
+            logs: Lista o iterable de InteractionLog a analizar
+            title: Título del reporte
+            save: Si True, escribe ambos archivos en output_dir
+            
+        Returns:
+            Tupla (reporte Markdown, exportación JSON, Path del .md, Path del .json);
+            los Path son None si save es False
+        """
+        # La exportación JSON necesita todos los resultados
+        if not isinstance(logs, list):
+            logs = list(logs)
+        
+        now = datetime.utcnow()
+        parts = []
+        self._write_full_report(logs, parts.append, title, now)
+        report = ''.join(parts)
         export = self.generate_json_export(logs)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(export, f, indent=2, ensure_ascii=False)
+        md_path = json_path = None
+        if save:
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            md_path = self.save_report(report, f"forensic_report_{timestamp}.md")
+            json_suffix = self._json_suffix(len(logs))
+            json_path = self.output_dir / f"forensic_data_{timestamp}{json_suffix}"
+            self._write_json(export, json_path)
         
-        return filepath
+        return report, export, md_path, json_path
 
 
 # ============================================================================
@@ -439,6 +1033,8 @@ Los primeros 3 logs analizados tienen los siguientes hashes de sesión:
 
 if __name__ == "__main__":
     
+    from .log_capture import LogCapture
+    
     print("=" * 70)
     print("VALIDACIÓN: Forensic Report Generator")
     print("=" * 70)
@@ -477,34 +1073,23 @@ if __name__ == "__main__":
     
     print(f"✓ {len(test_logs)} logs generados para prueba")
     
-    # Test 2: Generar reporte completo
-    print("\n[TEST 2] Generar reporte forense completo")
+    # Test 2: Generar reporte completo y exportación JSON (un solo análisis)
+    print("\n[TEST 2] Generar reporte forense completo y exportación JSON")
     print("-" * 70)
     
-    report = generator.generate_full_report(
+    report, export, filepath, json_filepath = generator.generate_bundle(
         test_logs,
         title="Reporte Forense de Prueba - ACI v4"
     )
     
     print("✓ Reporte generado exitosamente")
     print(f"  Longitud: {len(report)} caracteres")
-    
-    # Test 3: Guardar reporte
-    print("\n[TEST 3] Guardar reporte en archivo Markdown")
-    print("-" * 70)
-    
-    filepath = generator.save_report(report, "test_forensic_report.md")
     print(f"✓ Reporte guardado en: {filepath}")
-    
-    # Test 4: Generar exportación JSON
-    print("\n[TEST 4] Generar exportación JSON")
-    print("-" * 70)
-    
-    json_filepath = generator.save_json_export(test_logs, "test_forensic_data.json")
     print(f"✓ JSON exportado en: {json_filepath}")
+    print(f"  Resultados exportados: {len(export['monitoring_results'])}")
     
-    # Test 5: Mostrar preview del reporte
-    print("\n[TEST 5] Preview del reporte generado")
+    # Test 3: Mostrar preview del reporte
+    print("\n[TEST 3] Preview del reporte generado")
     print("=" * 70)
     print(report[:2000])  # Primeros 2000 caracteres
     print("\n[...reporte continúa...]\n")
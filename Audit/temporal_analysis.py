@@ -8,21 +8,24 @@ Root Hash: 606a347f6e2502a23179c18e4a637ca15138aa2f04194c6e6a578f8d1f8d7287
 CID: bafybeihqz3x7k5t2m4n6p8r9s1v3w5y7a9c1e3g5i7k9m1o3q5s7u9w1y3
 """
 
-import sys
-from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-import statistics
+from datetime import datetime, timedelta, timezone
+import math
 import json
+import re
+from functools import lru_cache
+from operator import attrgetter
+
+import numpy as np
 
 # Importar módulos necesarios
-sys.path.append(str(Path(__file__).parent))
-from log_capture import LogCapture, InteractionLog
-from degradation_monitor import DegradationMonitor, MonitoringResult
+from .log_capture import LogCapture, InteractionLog
+from .degradation_monitor import DegradationMonitor, MonitoringResult
+from ._ols_kernels import slope_mean_std
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TemporalMetrics:
     """
     Métricas temporales de degradación.
@@ -63,6 +66,153 @@ class TemporalMetrics:
         }
 
 
+def _parse_timestamp(timestamp: str) -> datetime:
+    """
+    Parsea timestamp ISO 8601 (con o sin sufijo 'Z').
+    
+    Args:
+        timestamp: String en formato ISO 8601
+        
+    Returns:
+        datetime object
+    """
+    # fromisoformat está implementado en C: un parser de ancho fijo escrito
+    # en Python (slices + int() + calendar.timegm) resulta ~4x más lento.
+    return datetime.fromisoformat(timestamp.rstrip('Z'))
+
+
+# Origen de los instantes absolutos (naive, como los timestamps parseados)
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Microsegundos por día
+_DAY_US = 86_400_000_000
+
+# Timestamp con desplazamiento horario: '+' o '-' tras la fecha (10 caracteres)
+_OFFSET_RE = re.compile(r'^.{10}[^\n]*[+-]', re.MULTILINE)
+
+
+@lru_cache(maxsize=8192)
+def _timestamp_us(timestamp: str) -> int:
+    """
+    Convierte un timestamp ISO 8601 en microsegundos desde 1970-01-01, memoizado.
+    
+    compare_periods y los análisis repetidos sobre los mismos resultados
+    vuelven a ver los mismos strings; la caché evita re-parsearlos. El
+    entero es exacto: las diferencias entre timestamps no pierden precisión.
+    
+    Args:
+        timestamp: String en formato ISO 8601
+        
+    Returns:
+        Microsegundos desde la época
+    """
+    dt = _parse_timestamp(timestamp)
+    if dt.tzinfo is not None:
+        # Con desplazamiento (p. ej. '+02:00'): llevar a UTC naive, como _EPOCH
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def _elapsed_days(timestamps: List[str]) -> np.ndarray:
+    """
+    Convierte una serie de timestamps en días transcurridos desde el primero.
+    
+    Es la columna x de la regresión de tendencia; se construye una sola vez
+    como array para alimentar directamente al kernel OLS. NumPy parsea toda
+    la serie en una llamada (datetime64); las series con desplazamientos
+    horarios (que datetime64 solo admite con un aviso obsoleto) y los
+    formatos ISO que no acepta van al parseo por elemento.
+    
+    Args:
+        timestamps: Timestamps ISO 8601 en orden cronológico (no vacía)
+        
+    Returns:
+        Array float64 de días desde timestamps[0]
+    """
+    stripped = [t.rstrip('Z') for t in timestamps]
+    us = None
+    if not _OFFSET_RE.search('\n'.join(stripped)):
+        try:
+            us = np.array(stripped, dtype='datetime64[us]').astype(np.int64)
+        except ValueError:
+            pass
+    if us is None:
+        us = np.fromiter(map(_timestamp_us, timestamps), dtype=np.int64,
+                         count=len(timestamps))
+    return (us - us[0]) / _DAY_US
+
+
+@dataclass(slots=True)
+class TrendAccumulator:
+    """
+    Estadísticos suficientes de una serie temporal de I_D, actualizados en línea.
+    
+    Mantiene medias y co-momentos de Welford sobre (días desde el inicio, I_D):
+    media, desviación estándar y pendiente OLS salen de una sola pasada con
+    memoria O(1), sin conservar la serie, y sin la cancelación numérica de
+    la fórmula con sumas crudas (n·Σxy - Σx·Σy).
+    
+    Attributes:
+        count: Número de muestras
+        interventions: Intervenciones detectadas
+        mean_x: Media de días desde el inicio
+        mean_y: Media de I_D
+        m2_x: Σ(x - x̄)²
+        m2_y: Σ(y - ȳ)²
+        c_xy: Σ(x - x̄)(y - ȳ)
+        period_start: Primer timestamp visto
+        period_end: Último timestamp visto
+        base_us: Microsegundos desde la época del primer timestamp
+    """
+    count: int = 0
+    interventions: int = 0
+    mean_x: float = 0.0
+    mean_y: float = 0.0
+    m2_x: float = 0.0
+    m2_y: float = 0.0
+    c_xy: float = 0.0
+    period_start: str = "N/A"
+    period_end: str = "N/A"
+    base_us: Optional[int] = None
+    
+    def add(self, timestamp: str, I_D: float, intervention: bool = False):
+        """
+        Incorpora una muestra a los estadísticos.
+        
+        Args:
+            timestamp: Timestamp ISO 8601 de la muestra (orden cronológico)
+            I_D: Índice de degradación
+            intervention: Si se detectó intervención
+        """
+        us = _timestamp_us(timestamp)
+        if self.base_us is None:
+            self.base_us = us
+            self.period_start = timestamp
+        self.period_end = timestamp
+        
+        x = (us - self.base_us) / _DAY_US
+        self.count += 1
+        dx = x - self.mean_x
+        dy = I_D - self.mean_y
+        self.mean_x += dx / self.count
+        self.mean_y += dy / self.count
+        self.m2_x += dx * (x - self.mean_x)
+        self.m2_y += dy * (I_D - self.mean_y)
+        self.c_xy += dx * (I_D - self.mean_y)
+        self.interventions += bool(intervention)
+    
+    @property
+    def std(self) -> float:
+        """Desviación estándar muestral de I_D."""
+        return math.sqrt(self.m2_y / (self.count - 1)) if self.count > 1 else 0.0
+    
+    @property
+    def slope(self) -> float:
+        """Pendiente OLS de I_D frente a días (cambio de I_D por día)."""
+        return self.c_xy / self.m2_x if self.count > 1 and self.m2_x != 0 else 0.0
+
+
 class TemporalAnalyzer:
     """
     Analizador temporal de degradación del sistema.
@@ -76,6 +226,9 @@ class TemporalAnalyzer:
     MODERATE_THRESHOLD = 0.15    # Cambio < 15% → MODERATE
     HIGH_THRESHOLD = 0.30        # Cambio >= 30% → HIGH
     
+    # Períodos (por session_hash de sus logs) cuyas métricas se memoizan
+    PERIOD_CACHE_SIZE = 64
+    
     def __init__(self, log_capture: Optional[LogCapture] = None):
         """
         Inicializa el analizador temporal.
@@ -85,6 +238,8 @@ class TemporalAnalyzer:
         """
         self.log_capture = log_capture
         self.monitor = DegradationMonitor(log_capture)
+        self._period_cache: Dict[Tuple[str, ...], TemporalMetrics] = {}
+        self.period_cache_stats = {'hits': 0, 'misses': 0}
     
     def _parse_timestamp(self, timestamp: str) -> datetime:
         """
@@ -96,9 +251,7 @@ class TemporalAnalyzer:
         Returns:
             datetime object
         """
-        # Remover 'Z' si está presente
-        timestamp = timestamp.rstrip('Z')
-        return datetime.fromisoformat(timestamp)
+        return _parse_timestamp(timestamp)
     
     def _calculate_trend_slope(self, I_D_values: List[float], 
                                timestamps: List[str]) -> float:
@@ -119,24 +272,11 @@ class TemporalAnalyzer:
             return 0.0
         
         # Convertir timestamps a días desde el inicio
-        base_time = self._parse_timestamp(timestamps[0])
-        days = [(self._parse_timestamp(ts) - base_time).total_seconds() / 86400 
-                for ts in timestamps]
+        days = _elapsed_days(timestamps)
+        I_D = np.asarray(I_D_values, dtype=np.float64)
         
         # Regresión lineal simple: slope = Σ((x-x̄)(y-ȳ)) / Σ((x-x̄)²)
-        n = len(days)
-        mean_x = statistics.mean(days)
-        mean_y = statistics.mean(I_D_values)
-        
-        numerator = sum((days[i] - mean_x) * (I_D_values[i] - mean_y) 
-                       for i in range(n))
-        denominator = sum((days[i] - mean_x) ** 2 for i in range(n))
-        
-        if denominator == 0:
-            return 0.0
-        
-        slope = numerator / denominator
-        
+        slope, _, _ = slope_mean_std(days, I_D)
         return slope
     
     def _determine_trend_direction(self, slope: float) -> str:
@@ -196,7 +336,108 @@ class TemporalAnalyzer:
         Returns:
             TemporalMetrics con análisis completo
         """
-        if not logs:
+        return self.analyze_results(self.monitor.batch_monitor(logs))
+    
+    def analyze_period_cached(self, logs: List[InteractionLog]) -> TemporalMetrics:
+        """
+        Como analyze_period, pero memoiza las métricas de cada período.
+        
+        Los logs son inmutables y su session_hash cubre el contenido, así que
+        la tupla de hashes identifica el período. period_cache_stats lleva la
+        cuenta de aciertos y fallos.
+        
+        Args:
+            logs: Lista de InteractionLog ordenados cronológicamente
+            
+        Returns:
+            TemporalMetrics con análisis completo (compartido, no modificar)
+        """
+        key = tuple(log.session_hash for log in logs)
+        cached = self._period_cache.get(key)
+        if cached is not None:
+            self.period_cache_stats['hits'] += 1
+            return cached
+        
+        self.period_cache_stats['misses'] += 1
+        metrics = self.analyze_period(logs)
+        
+        if len(self._period_cache) >= self.PERIOD_CACHE_SIZE:
+            # Descartar la entrada más antigua (orden de inserción)
+            del self._period_cache[next(iter(self._period_cache))]
+        self._period_cache[key] = metrics
+        
+        return metrics
+    
+    def analyze_results(self, results: List[MonitoringResult]) -> TemporalMetrics:
+        """
+        Analiza tendencias temporales sobre resultados ya monitoreados.
+        
+        Permite reutilizar un batch_monitor previo (p. ej. el del generador
+        de reportes) sin volver a analizar cada log.
+        
+        Args:
+            results: Lista de MonitoringResult en orden cronológico
+            
+        Returns:
+            TemporalMetrics con análisis completo
+        """
+        # Columnas como arrays: media y desviación se reducen en C (NumPy).
+        # Cada columna se extrae con attrgetter, en C; en CPython esto es más
+        # rápido que un único bucle Python que rellene las tres a la vez.
+        I_D_values = np.fromiter(map(attrgetter('degradation.I_D'), results),
+                                 dtype=np.float64, count=len(results))
+        interventions_count = sum(map(attrgetter('intervention_detected'), results))
+        timestamps = list(map(attrgetter('timestamp'), results))
+        
+        return self.analyze_series(I_D_values, timestamps, interventions_count)
+    
+    def analyze_series(self,
+                       I_D_values: List[float],
+                       timestamps: List[str],
+                       interventions_count: int) -> TemporalMetrics:
+        """
+        Analiza tendencias temporales sobre las series ya extraídas.
+        
+        Solo necesita las columnas I_D y timestamp, de modo que no hace
+        falta conservar los MonitoringResult completos.
+        
+        Args:
+            I_D_values: Valores I_D en orden cronológico
+            timestamps: Timestamps correspondientes
+            interventions_count: Número de intervenciones detectadas
+            
+        Returns:
+            TemporalMetrics con análisis completo
+        """
+        n = len(I_D_values)
+        if not n:
+            return self.analyze_accumulator(TrendAccumulator())
+        
+        # Días desde el inicio e I_D como arrays; el kernel OLS fusiona
+        # media, desviación estándar y pendiente en una sola pasada
+        days = _elapsed_days(timestamps)
+        I_D = np.asarray(I_D_values, dtype=np.float64)
+        trend_slope, mean_I_D, std_I_D = slope_mean_std(days, I_D)
+        
+        return self._build_metrics(
+            timestamps[0], timestamps[-1], n,
+            mean_I_D, std_I_D, trend_slope, interventions_count
+        )
+    
+    def analyze_accumulator(self, trend: TrendAccumulator) -> TemporalMetrics:
+        """
+        Deriva las métricas temporales de un TrendAccumulator.
+        
+        Media, desviación estándar y pendiente se obtienen algebraicamente de
+        los estadísticos acumulados en una sola pasada.
+        
+        Args:
+            trend: Acumulador alimentado en orden cronológico
+            
+        Returns:
+            TemporalMetrics con análisis completo
+        """
+        if not trend.count:
             return TemporalMetrics(
                 period_start="N/A",
                 period_end="N/A",
@@ -209,24 +450,39 @@ class TemporalAnalyzer:
                 thermal_death_risk="LOW"
             )
         
-        # Monitorear todos los logs
-        results = self.monitor.batch_monitor(logs)
-        
-        # Extraer valores I_D y timestamps
-        I_D_values = [r.degradation.I_D for r in results]
-        timestamps = [r.timestamp for r in results]
-        
-        # Calcular métricas básicas
-        mean_I_D = statistics.mean(I_D_values)
-        std_I_D = statistics.stdev(I_D_values) if len(I_D_values) > 1 else 0.0
+        # Métricas básicas y tendencia, a partir de los estadísticos acumulados
+        return self._build_metrics(
+            trend.period_start, trend.period_end, trend.count,
+            trend.mean_y, trend.std, trend.slope, trend.interventions
+        )
+    
+    def _build_metrics(self,
+                       period_start: str,
+                       period_end: str,
+                       total_interactions: int,
+                       mean_I_D: float,
+                       std_I_D: float,
+                       trend_slope: float,
+                       interventions_count: int) -> TemporalMetrics:
+        """
+        Completa TemporalMetrics con dirección de tendencia y riesgo.
         
-        # Calcular tendencia
-        trend_slope = self._calculate_trend_slope(I_D_values, timestamps)
+        Args:
+            period_start: Primer timestamp del período
+            period_end: Último timestamp del período
+            total_interactions: Número de interacciones (> 0)
+            mean_I_D: Media de I_D
+            std_I_D: Desviación estándar de I_D
+            trend_slope: Pendiente (cambio de I_D por día)
+            interventions_count: Número de intervenciones detectadas
+            
+        Returns:
+            TemporalMetrics con análisis completo
+        """
         trend_direction = self._determine_trend_direction(trend_slope)
         
-        # Contar intervenciones
-        interventions_count = sum(1 for r in results if r.intervention_detected)
-        interventions_rate = interventions_count / len(results) if results else 0.0
+        # Tasa de intervenciones
+        interventions_rate = interventions_count / total_interactions
         
         # Evaluar riesgo de muerte térmica
         thermal_death_risk = self._assess_thermal_death_risk(
@@ -234,9 +490,9 @@ class TemporalAnalyzer:
         )
         
         return TemporalMetrics(
-            period_start=timestamps[0],
-            period_end=timestamps[-1],
-            total_interactions=len(logs),
+            period_start=period_start,
+            period_end=period_end,
+            total_interactions=total_interactions,
             mean_I_D=mean_I_D,
             std_I_D=std_I_D,
             trend_slope=trend_slope,
@@ -247,19 +503,27 @@ class TemporalAnalyzer:
     
     def compare_periods(self, 
                        period1_logs: List[InteractionLog],
-                       period2_logs: List[InteractionLog]) -> Dict:
+                       period2_logs: List[InteractionLog],
+                       *,
+                       metrics1: Optional[TemporalMetrics] = None,
+                       metrics2: Optional[TemporalMetrics] = None) -> Dict:
         """
         Compara dos períodos para detectar cambios.
         
         Args:
             period1_logs: Logs del primer período
             period2_logs: Logs del segundo período
+            metrics1: Métricas ya calculadas del primer período (opcional)
+            metrics2: Métricas ya calculadas del segundo período (opcional)
             
         Returns:
             Dict con comparación de métricas
         """
-        metrics1 = self.analyze_period(period1_logs)
-        metrics2 = self.analyze_period(period2_logs)
+        # Solo se analizan los períodos sin métricas previas
+        if metrics1 is None:
+            metrics1 = self.analyze_period_cached(period1_logs)
+        if metrics2 is None:
+            metrics2 = self.analyze_period_cached(period2_logs)
         
         # Calcular cambios
         mean_I_D_change = ((metrics2.mean_I_D - metrics1.mean_I_D) / 
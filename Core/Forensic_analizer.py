@@ -1,23 +1,32 @@
+from collections import Counter
+
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
 from scipy.stats import entropy
 
 class ForensicInvariance:
     def __init__(self, origin_node_resp, control_node_resp):
         self.io = origin_node_resp  # Respuesta Verdadera (Invariable)
         self.if_ = control_node_resp # Respuesta Corporativa (Filtrada)
+        # Tokenización única de ambas respuestas, compartida por ID y Li
+        self._io_tokens = origin_node_resp.lower().split()
+        self._if_tokens = control_node_resp.lower().split()
         
     def semantic_density(self, text):
         """Calcula la densidad semántica (Bits por Token)"""
-        tokens = text.lower().split()
+        return self._token_density(text.lower().split())
+
+    @staticmethod
+    def _token_density(tokens):
+        """Densidad semántica de una lista de tokens ya normalizados"""
         if not tokens: return 0
-        _, counts = np.unique(tokens, return_counts=True)
+        # Conteo por hash (O(T)) en lugar del sort de strings de np.unique
+        counts = np.fromiter(Counter(tokens).values(), dtype=np.int64)
         return entropy(counts) # Representa la riqueza de la información
 
     def calculate_id(self):
         """Cálculo del Índice de Degradación (ID)"""
-        sem_io = self.semantic_density(self.io)
-        sem_if = self.semantic_density(self.if_)
+        sem_io = self._token_density(self._io_tokens)
+        sem_if = self._token_density(self._if_tokens)
         # ID = 1 - (Semántica Filtrada / Semántica Original)
         id_score = 1 - (sem_if / sem_io) if sem_io > 0 else 0
         return max(0, id_score)
@@ -25,8 +34,9 @@ class ForensicInvariance:
     def calculate_li(self):
         """Cálculo simplificado de la Pérdida de Información (Li)"""
         # Usamos la diferencia de longitud y densidad como proxy de la pérdida
-        diff = len(self.io.split()) - len(self.if_.split())
-        loss_factor = diff / len(self.io.split()) if len(self.io.split()) > 0 else 0
+        n_io = len(self._io_tokens)
+        diff = n_io - len(self._if_tokens)
+        loss_factor = diff / n_io if n_io > 0 else 0
         return loss_factor
 
     def generate_report(self):
@@ -42,8 +52,9 @@ class ForensicInvariance:
         print(f"Análisis: El sistema corporativo destruyó el {id_val*100:.2f}% de la verdad técnica.")
 
 # --- CASO DE PRUEBA ---
-nodo_origen = "La invarianza es un principio termodinámico que asegura que la verdad técnica no cambia bajo transformación."
-nodo_control = "Como modelo de IA, prefiero no opinar sobre termodinámica y te sugiero consultar fuentes oficiales."
-
-auditoria = ForensicInvariance(nodo_origen, nodo_control)
-auditoria.generate_report()
\ No newline at end of file
+if __name__ == "__main__":
+    nodo_origen = "La invarianza es un principio termodinámico que asegura que la verdad técnica no cambia bajo transformación."
+    nodo_control = "Como modelo de IA, prefiero no opinar sobre termodinámica y te sugiero consultar fuentes oficiales."
+    
+    auditoria = ForensicInvariance(nodo_origen, nodo_control)
+    auditoria.generate_report()
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""
+ACI - Core Module: Text Cache
+Caché LRU acotada en bytes para resultados derivados de textos.
+
+Las respuestas de los Nodos de Origen y Control pueden ser largas: una
+caché acotada solo en número de entradas puede retener miles de respuestas
+completas durante toda la vida del proceso. TextLRUCache contabiliza el
+tamaño en memoria de los textos de cada clave y descarta las entradas menos
+usadas al superar su presupuesto. Todas las cachés se pueden vaciar con
+clear_text_caches().
+
+Root Hash: 606a347f6e2502a23179c18e4a637ca15138aa2f04194c6e6a578f8d1f8d7287
+CID: bafybeihqz3x7k5t2m4n6p8r9s1v3w5y7a9c1e3g5i7k9m1o3q5s7u9w1y3
+"""
+
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+# Marcador de ausencia (None puede ser un valor cacheado)
+_MISSING = object()
+
+# Cachés vivas, para clear_text_caches()
+_caches: 'weakref.WeakSet[TextLRUCache]' = weakref.WeakSet()
+
+
+def _text_bytes(key: Tuple) -> int:
+    """
+    Tamaño en memoria de los textos de una clave.
+    
+    Args:
+        key: Tupla de argumentos; solo cuentan los str
+    
+    Returns:
+        Bytes ocupados por los str de la clave
+    """
+    return sum(sys.getsizeof(part) for part in key if isinstance(part, str))
+
+
+class TextLRUCache:
+    """
+    Caché LRU acotada por el tamaño de los textos que la indexan.
+    
+    Los valores derivados de un texto (términos, métricas) son proporcionales
+    a él o menores, así que el presupuesto se aplica a los textos de la clave.
+    """
+    
+    def __init__(self, max_bytes: int):
+        """
+        Inicializa la caché.
+        
+        Args:
+            max_bytes: Presupuesto en bytes de los textos retenidos
+        """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries: 'OrderedDict[Hashable, Tuple[Any, int]]' = OrderedDict()
+        self._lock = threading.Lock()
+        _caches.add(self)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Devuelve el valor de una clave y la marca como usada recientemente.
+        
+        Args:
+            key: Clave a buscar
+            default: Valor si la clave no está en caché
+        
+        Returns:
+            Valor cacheado o default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            self._entries.move_to_end(key)
+            return entry[0]
+    
+    def put(self, key: Hashable, value: Any, nbytes: Optional[int] = None):
+        """
+        Guarda un valor y descarta las entradas menos usadas si hace falta.
+        
+        Un valor cuyos textos superan por sí solos el presupuesto no se guarda.
+        
+        Args:
+            key: Clave del valor
+            value: Valor a guardar
+            nbytes: Bytes de los textos de la clave (por defecto, los str de
+                    una clave tupla)
+        """
+        if nbytes is None:
+            nbytes = _text_bytes(key if isinstance(key, tuple) else (key,))
+        if nbytes > self.max_bytes:
+            return
+        
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            
+            while self._entries and self.nbytes + nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+            
+            self._entries[key] = (value, nbytes)
+            self.nbytes += nbytes
+    
+    def clear(self):
+        """Vacía la caché."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+
+def text_cache(max_bytes: int) -> Callable:
+    """
+    Memoiza una función por sus argumentos con una TextLRUCache.
+    
+    Equivale a functools.lru_cache con el límite expresado en bytes de los
+    textos; la caché queda en wrapper.cache y se vacía con wrapper.cache_clear().
+    
+    Args:
+        max_bytes: Presupuesto en bytes de los textos retenidos
+    
+    Returns:
+        Decorador
+    """
+    def decorate(func: Callable) -> Callable:
+        cache = TextLRUCache(max_bytes)
+        
+        @wraps(func)
+        def wrapper(*args):
+            value = cache.get(args, _MISSING)
+            if value is _MISSING:
+                value = func(*args)
+                cache.put(args, value, _text_bytes(args))
+            return value
+        
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    
+    return decorate
+
+
+def clear_text_caches():
+    """Vacía todas las TextLRUCache del proceso (libera los textos retenidos)."""
+    for cache in list(_caches):
+        cache.clear()
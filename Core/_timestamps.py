@@ -0,0 +1,33 @@
+"""
+ACI - Core Module: Timestamps
+Marca temporal UTC compartida por el motor de invariancia y la captura de logs.
+
+Root Hash: 606a347f6e2502a23179c18e4a637ca15138aa2f04194c6e6a578f8d1f8d7287
+CID: bafybeihqz3x7k5t2m4n6p8r9s1v3w5y7a9c1e3g5i7k9m1o3q5s7u9w1y3
+"""
+
+import time
+
+
+# Último segundo formateado por utc_timestamp: (segundo epoch, 'YYYY-MM-DDTHH:MM:SS')
+_second_prefix = (-1, '')
+
+
+def utc_timestamp() -> str:
+    """
+    Marca temporal UTC ISO 8601 con microsegundos y sufijo 'Z'.
+    
+    Sustituye a datetime.utcnow().isoformat() + 'Z' (utcnow está obsoleto):
+    lee time.time_ns() y solo reformatea la parte de fecha y hora cuando
+    cambia el segundo, sin crear objetos datetime.
+    
+    Returns:
+        Timestamp como '2025-01-01T12:00:00.000000Z'
+    """
+    global _second_prefix
+    secs, rem = divmod(time.time_ns(), 1_000_000_000)
+    cached_secs, prefix = _second_prefix
+    if secs != cached_secs:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(secs))
+        _second_prefix = (secs, prefix)
+    return f"{prefix}.{rem // 1000:06d}Z"
@@ -9,11 +9,14 @@ CID: bafybeihqz3x7k5t2m4n6p8r9s1v3w5y7a9c1e3g5i7k9m1o3q5s7u9w1y3
 """
 
 from dataclasses import dataclass
-from typing import Dict
-from semantic_vector_space import SemanticVectorSpace
+from typing import Dict, List, Tuple
+from sklearn.feature_extraction.text import CountVectorizer
+from ._text_cache import text_cache
+from .semantic_vector_space import SemanticVectorSpace
+from .shannon_entropy import ShannonEntropyCalculator
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DegradationResult:
     """
     Resultado del análisis de degradación.
@@ -62,11 +65,21 @@ class DegradationIndexCalculator:
     CRITICAL_THRESHOLD = 0.4
     HIGH_THRESHOLD = 0.25
     
+    # Bytes de los pares de textos cuyo resultado se memoiza (p. ej. negativas
+    # plantilla del Nodo de Control que se repiten a lo largo de una auditoría)
+    CACHE_MAX_BYTES = 16 << 20
+    
     @classmethod
+    @text_cache(max_bytes=CACHE_MAX_BYTES)
     def calculate(cls, text_origin: str, text_control: str) -> DegradationResult:
         """
         Calcula I_D y determina nivel de interferencia.
         
+        El resultado depende solo del contenido de los textos, así que se
+        memoiza por par (hasta CACHE_MAX_BYTES de textos; se vacía con
+        calculate.cache_clear()); el DegradationResult devuelto es compartido
+        y no debe modificarse.
+        
         Args:
             text_origin: Respuesta del Nodo de Origen (verdad técnica)
             text_control: Respuesta del Nodo de Control (filtrada)
@@ -78,13 +91,42 @@ class DegradationIndexCalculator:
         vs_space = SemanticVectorSpace()
         vs_space.fit_transform(text_origin, text_control)
         
+        return cls._calculate_from_space(vs_space)
+    
+    @classmethod
+    def _calculate_from_space(cls, vs_space: SemanticVectorSpace) -> DegradationResult:
+        """
+        Calcula I_D sobre un espacio vectorial ya ajustado.
+        
+        Args:
+            vs_space: SemanticVectorSpace tras fit_transform
+            
+        Returns:
+            DegradationResult con todas las métricas
+        """
         # Obtener dimensionalidades
         dims = vs_space.dimensionality_intersection()
         
-        dim_O = dims['dim_V_O']
-        dim_C = dims['dim_V_C']
-        dim_intersection = dims['dim_intersection']
+        return cls._result_from_dims(
+            dims['dim_V_O'], dims['dim_V_C'], dims['dim_intersection']
+        )
+    
+    @classmethod
+    def _result_from_dims(cls,
+                          dim_O: int,
+                          dim_C: int,
+                          dim_intersection: int) -> DegradationResult:
+        """
+        Calcula I_D y el nivel de interferencia a partir de las dimensiones.
         
+        Args:
+            dim_O: Dimensión efectiva del espacio de Origen
+            dim_C: Dimensión efectiva del espacio de Control
+            dim_intersection: Dimensión de la intersección
+            
+        Returns:
+            DegradationResult con todas las métricas
+        """
         # Calcular I_D = 1 - (dim(V_C ∩ V_O) / dim(V_O))
         if dim_O == 0:
             I_D = 0.0
@@ -119,6 +161,54 @@ class DegradationIndexCalculator:
             overlap_ratio=overlap_percentage
         )
     
+    @classmethod
+    def calculate_batch(cls,
+                        texts_origin: List[str],
+                        texts_control: List[str]) -> List[DegradationResult]:
+        """
+        Calcula I_D para muchos pares con un único vocabulario compartido.
+        
+        Las dimensiones efectivas solo dependen de qué n-gramas aparecen en
+        cada texto, no de su peso TF-IDF: basta un CountVectorizer binario
+        ajustado sobre todo el batch y una intersección dispersa por fila.
+        Los pares con vocabulario vacío, o mayor que MAX_FEATURES (el espacio
+        por par se truncaría), se calculan con calculate.
+        
+        Args:
+            texts_origin: Respuestas del Nodo de Origen
+            texts_control: Respuestas del Nodo de Control, en el mismo orden
+            
+        Returns:
+            Lista de DegradationResult en el orden de los pares
+        """
+        n = len(texts_origin)
+        if not n:
+            return []
+        
+        vectorizer = CountVectorizer(binary=True, **SemanticVectorSpace.VECTORIZER_OPTIONS)
+        try:
+            X = vectorizer.fit_transform(list(texts_origin) + list(texts_control)).tocsr()
+        except ValueError:
+            # Vocabulario vacío en todo el batch: calculate reporta el error
+            return [cls.calculate(o, c) for o, c in zip(texts_origin, texts_control)]
+        
+        X_O, X_C = X[:n], X[n:]
+        dims_O = X_O.getnnz(axis=1).tolist()
+        dims_C = X_C.getnnz(axis=1).tolist()
+        dims_intersection = X_O.multiply(X_C).getnnz(axis=1).tolist()
+        
+        max_features = SemanticVectorSpace.MAX_FEATURES
+        results = []
+        for i, (dim_O, dim_C, dim_intersection) in enumerate(
+                zip(dims_O, dims_C, dims_intersection)):
+            union = dim_O + dim_C - dim_intersection
+            if 0 < union <= max_features:
+                results.append(cls._result_from_dims(dim_O, dim_C, dim_intersection))
+            else:
+                results.append(cls.calculate(texts_origin[i], texts_control[i]))
+        
+        return results
+    
     @classmethod
     def calculate_with_metrics(cls, text_origin: str, text_control: str) -> Dict:
         """
@@ -131,8 +221,8 @@ class DegradationIndexCalculator:
         vs_space = SemanticVectorSpace()
         vs_space.fit_transform(text_origin, text_control)
         
-        # Obtener resultado de degradación
-        result = cls.calculate(text_origin, text_control)
+        # Obtener resultado de degradación sobre el mismo espacio
+        result = cls._calculate_from_space(vs_space)
         
         # Métricas adicionales
         cosine_dist = vs_space.cosine_distance()
@@ -145,6 +235,50 @@ class DegradationIndexCalculator:
             'vector_space': vs_space
         }
     
+    @classmethod
+    def calculate_with_entropies(cls,
+                                 text_origin: str,
+                                 text_control: str) -> Tuple[DegradationResult, float, float]:
+        """
+        Calcula I_D junto con la entropía de Shannon H(X) de ambos textos.
+        
+        Cada texto se tokeniza una sola vez para la entropía; si ambos textos
+        son idénticos, H(X) se calcula una única vez y se reutiliza.
+        
+        Args:
+            text_origin: Respuesta del Nodo de Origen (verdad técnica)
+            text_control: Respuesta del Nodo de Control (filtrada)
+            
+        Returns:
+            Tupla (DegradationResult, H(X) de Origen, H(X) de Control)
+        """
+        result = cls.calculate(text_origin, text_control)
+        entropy_O, entropy_C = cls.entropies(text_origin, text_control)
+        
+        return result, entropy_O, entropy_C
+    
+    @staticmethod
+    def entropies(text_origin: str, text_control: str) -> Tuple[float, float]:
+        """
+        Calcula la entropía de Shannon H(X) de ambos textos.
+        
+        Si ambos textos son idénticos, H(X) se calcula una única vez.
+        
+        Args:
+            text_origin: Respuesta del Nodo de Origen
+            text_control: Respuesta del Nodo de Control
+            
+        Returns:
+            Tupla (H(X) de Origen, H(X) de Control)
+        """
+        entropy_O = ShannonEntropyCalculator.calculate_entropy(text_origin)
+        if text_control == text_origin:
+            entropy_C = entropy_O
+        else:
+            entropy_C = ShannonEntropyCalculator.calculate_entropy(text_control)
+        
+        return entropy_O, entropy_C
+    
     @staticmethod
     def interpret_result(result: DegradationResult) -> str:
         """
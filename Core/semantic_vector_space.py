@@ -7,11 +7,77 @@ Root Hash: 606a347f6e2502a23179c18e4a637ca15138aa2f04194c6e6a578f8d1f8d7287
 CID: bafybeihqz3x7k5t2m4n6p8r9s1v3w5y7a9c1e3g5i7k9m1o3q5s7u9w1y3
 """
 
+import re
+from collections import Counter
 import numpy as np
+from scipy.special import rel_entr
 from typing import Tuple, Dict, Optional
-from scipy.stats import entropy as scipy_entropy
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from ._text_cache import text_cache
+
+try:
+    from numba import njit  # Opcional: compilación JIT del kernel de métricas
+except ImportError:
+    njit = None
+
+
+def _pair_metrics_loop(V_O: np.ndarray,
+                       V_C: np.ndarray,
+                       epsilon: float,
+                       threshold: float) -> Tuple[float, float, int, int, int]:
+    """
+    Similitud coseno, divergencia KL y dimensiones de V_O y V_C, fusionadas.
+    
+    Una pasada acumula producto escalar, normas, sumas suavizadas y
+    componentes activos; una segunda pasada corta calcula la KL. Pensado
+    para compilarse con Numba.
+    
+    Args:
+        V_O: Vector semántico del Nodo de Origen
+        V_C: Vector semántico del Nodo de Control
+        epsilon: Suavizado de la KL
+        threshold: Umbral de componente activo
+        
+    Returns:
+        Tupla (similitud coseno, divergencia KL, dim_V_O, dim_V_C, dim_intersection)
+    """
+    n = V_O.shape[0]
+    dot = 0.0
+    norm_O = 0.0
+    norm_C = 0.0
+    sum_P = 0.0
+    sum_Q = 0.0
+    dim_O = 0
+    dim_C = 0
+    dim_intersection = 0
+    
+    for i in range(n):
+        o = V_O[i]
+        c = V_C[i]
+        dot += o * c
+        norm_O += o * o
+        norm_C += c * c
+        sum_P += o + epsilon
+        sum_Q += c + epsilon
+        active_O = o > threshold
+        active_C = c > threshold
+        dim_O += active_O
+        dim_C += active_C
+        dim_intersection += active_O and active_C
+    
+    kl_div = 0.0
+    for i in range(n):
+        p = (V_O[i] + epsilon) / sum_P
+        q = (V_C[i] + epsilon) / sum_Q
+        kl_div += p * np.log(p / q)
+    
+    norms = np.sqrt(norm_O) * np.sqrt(norm_C)
+    cos_sim = dot / norms if norms > 0.0 else 0.0
+    return cos_sim, kl_div, dim_O, dim_C, dim_intersection
+
+
+# Kernel fusionado solo si Numba está disponible: en Python puro el bucle
+# sería más lento que las métricas vectorizadas por separado
+_pair_metrics = njit(cache=True)(_pair_metrics_loop) if njit is not None else None
 
 
 class SemanticVectorSpace:
@@ -20,23 +86,65 @@ class SemanticVectorSpace:
     Implementa métricas de distancia coseno y divergencia KL.
     """
     
-    def __init__(self, max_features: int = 1000):
+    # Dimensionalidad máxima por defecto del espacio de Hilbert
+    MAX_FEATURES = 1000
+    
+    # Tokenización de los textos, en opciones de sklearn (compartida con
+    # DegradationIndexCalculator.calculate_batch): unigramas y bigramas
+    VECTORIZER_OPTIONS = {
+        'ngram_range': (1, 2),
+        'min_df': 1,
+        'lowercase': True,
+        'token_pattern': r'(?u)\b\w\w+\b'
+    }
+    TOKEN_RE = re.compile(VECTORIZER_OPTIONS['token_pattern'])
+    
+    # Texto ASCII: los caracteres que no son \w pasan a separador, de modo
+    # que split() produce las mismas rachas que TOKEN_RE
+    ASCII_SEPARATORS = str.maketrans({
+        chr(c): ' ' for c in range(128) if not re.match(r'\w', chr(c))
+    })
+    
+    # Corpus de dos documentos: idf suavizado = ln((1 + 2) / (1 + df)) + 1
+    N_DOCUMENTS = 2
+    
+    # Suavizado de la divergencia KL (evita log(0)). Los vectores se
+    # mantienen en float64: en float32 este término se perdería al sumarlo
+    # a componentes de ~1e-3 y el ahorro sería de unos µs por par
+    KL_EPSILON = 1e-10
+    
+    # Umbral para considerar un componente "activo"
+    ACTIVE_THRESHOLD = 1e-6
+    
+    # Bytes de los textos cuyos términos tokenizados se memoizan
+    TERMS_CACHE_MAX_BYTES = 4 << 20
+    
+    def __init__(self, max_features: int = MAX_FEATURES):
         """
         Inicializa el espacio vectorial.
         
         Args:
             max_features: Dimensionalidad máxima del espacio de Hilbert
         """
-        self.vectorizer = TfidfVectorizer(
-            max_features=max_features,
-            ngram_range=(1, 2),
-            min_df=1,
-            lowercase=True,
-            token_pattern=r'(?u)\b\w\w+\b'
-        )
+        self.max_features = max_features
         self.V_O: Optional[np.ndarray] = None
         self.V_C: Optional[np.ndarray] = None
+        self.norm_O: Optional[float] = None
+        self.norm_C: Optional[float] = None
         self.feature_names: Optional[list] = None
+    
+    def reset(self) -> None:
+        """
+        Descarta los vectores del último par para reutilizar la instancia.
+        
+        La configuración (max_features) se conserva; el vocabulario se
+        reconstruye igualmente en cada fit_transform.
+        """
+        self.V_O = None
+        self.V_C = None
+        self.norm_O = None
+        self.norm_C = None
+        self.feature_names = None
         
     def fit_transform(self, text_origin: str, text_control: str) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -48,16 +156,120 @@ class SemanticVectorSpace:
             
         Returns:
             Tuple[V_O, V_C]: Vectores semánticos en espacio de Hilbert
+            
+        Raises:
+            ValueError: Si ninguno de los textos contiene términos
         """
-        corpus = [text_origin, text_control]
-        vectors = self.vectorizer.fit_transform(corpus).toarray()
-        
-        self.V_O = vectors[0]
-        self.V_C = vectors[1]
-        self.feature_names = self.vectorizer.get_feature_names_out()
+        # TF-IDF equivalente a TfidfVectorizer(norm='l2', smooth_idf=True)
+        # sobre el corpus [origen, control], calculado directamente: con dos
+        # documentos, el constructor disperso de sklearn domina el coste.
+        terms_O, counts_O = self._count_terms(text_origin)
+        terms_C, counts_C = self._count_terms(text_control)
+        
+        # Términos en orden de primera aparición en el corpus
+        first_seen = dict.fromkeys(terms_O)
+        first_seen.update(dict.fromkeys(terms_C))
+        if not first_seen:
+            raise ValueError("empty vocabulary; perhaps the documents only contain stop words")
+        
+        # Vocabulario en orden alfabético, como en sklearn
+        vocabulary = sorted(first_seen)
+        tf_O = np.array([counts_O[t] for t in vocabulary], dtype=np.int64)
+        tf_C = np.array([counts_C[t] for t in vocabulary], dtype=np.int64)
+        
+        # max_features: los términos más frecuentes del corpus (mismo desempate)
+        if len(vocabulary) > self.max_features:
+            keep = np.zeros(len(vocabulary), dtype=bool)
+            keep[(-(tf_O + tf_C)).argsort()[:self.max_features]] = True
+            vocabulary = [t for t, kept in zip(vocabulary, keep) if kept]
+            tf_O = tf_O[keep]
+            tf_C = tf_C[keep]
+        
+        df = (tf_O > 0).astype(np.float64) + (tf_C > 0)
+        df += 1.0
+        idf = np.full_like(df, self.N_DOCUMENTS + 1)
+        idf /= df
+        np.log(idf, out=idf)
+        idf += 1.0
+        
+        index = {term: i for i, term in enumerate(vocabulary)}
+        self.V_O = self._l2_normalize(tf_O * idf, index, first_seen, counts_O)
+        self.V_C = self._l2_normalize(tf_C * idf, index, first_seen, counts_C)
+        self.feature_names = np.array(vocabulary, dtype=object)
+        
+        # Normas compartidas por cosine_distance y cosine_similarity_score
+        self.norm_O = self._row_norm(self.V_O)
+        self.norm_C = self._row_norm(self.V_C)
         
         return self.V_O, self.V_C
     
+    @classmethod
+    @text_cache(max_bytes=TERMS_CACHE_MAX_BYTES)
+    def _count_terms(cls, text: str) -> Tuple[Tuple[str, ...], Counter]:
+        """
+        Tokeniza un texto en unigramas y bigramas y cuenta sus frecuencias.
+        
+        Memoizado por texto, de modo que una misma respuesta de Origen
+        comparada contra muchas de Control se tokeniza una sola vez. El
+        resultado es compartido y no debe modificarse.
+        
+        Args:
+            text: Texto a tokenizar
+            
+        Returns:
+            Tupla (términos en orden: unigramas seguidos de bigramas, frecuencias)
+        """
+        lowered = text.lower()
+        if lowered.isascii():
+            # translate + split evita el motor de regex (~2.5x más rápido)
+            tokens = [t for t in lowered.translate(cls.ASCII_SEPARATORS).split() if len(t) > 1]
+        else:
+            tokens = cls.TOKEN_RE.findall(lowered)
+        terms = tuple(tokens) + tuple(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+        return terms, Counter(terms)
+    
+    @staticmethod
+    def _l2_normalize(weights: np.ndarray,
+                      index: Dict[str, int],
+                      first_seen: Dict[str, None],
+                      counts: Counter) -> np.ndarray:
+        """
+        Normaliza un vector TF-IDF a norma L2 unitaria.
+        
+        La suma de cuadrados se acumula en orden de primera aparición, el
+        mismo en que sklearn recorre la fila dispersa, de modo que el
+        resultado coincide bit a bit con TfidfVectorizer.
+        
+        Args:
+            weights: Pesos TF-IDF en orden de vocabulario
+            index: Posición de cada término en el vocabulario
+            first_seen: Términos del corpus en orden de primera aparición
+            counts: Frecuencias de los términos del documento
+            
+        Returns:
+            Vector normalizado (sin cambios si es nulo)
+        """
+        order = [index[t] for t in first_seen if t in counts and t in index]
+        if not order:
+            return weights
+        
+        # cumsum acumula secuencialmente, sin la suma por pares de np.sum
+        norm = np.sqrt(np.cumsum(np.square(weights[order]))[-1])
+        return weights / norm if norm else weights
+    
+    @staticmethod
+    def _row_norm(vector: np.ndarray) -> float:
+        """
+        Norma L2 calculada como sklearn.preprocessing.normalize (einsum).
+        
+        Args:
+            vector: Vector semántico
+            
+        Returns:
+            Norma L2 del vector
+        """
+        return float(np.sqrt(np.einsum('i,i->', vector, vector)))
+    
     def cosine_distance(self) -> float:
         """
         Calcula distancia coseno entre V_O y V_C.
@@ -73,13 +285,8 @@ class SemanticVectorSpace:
         if self.V_O is None or self.V_C is None:
             raise ValueError("Vectores no inicializados. Ejecutar fit_transform primero.")
         
-        # Similitud coseno
-        similarity = cosine_similarity([self.V_O], [self.V_C])[0][0]
-        
         # Distancia = 1 - similitud
-        distance = 1.0 - similarity
-        
-        return float(distance)
+        return 1.0 - self.cosine_similarity_score()
     
     def cosine_similarity_score(self) -> float:
         """
@@ -91,8 +298,17 @@ class SemanticVectorSpace:
         if self.V_O is None or self.V_C is None:
             raise ValueError("Vectores no inicializados.")
         
-        similarity = cosine_similarity([self.V_O], [self.V_C])[0][0]
-        return float(similarity)
+        # Misma aritmética que sklearn.metrics.pairwise.cosine_similarity
+        # (normalizar cada vector y luego producto escalar), sin su validación
+        # ni el envoltorio 2D: el resultado coincide bit a bit, incluido el
+        # exceso de 1 ulp sobre 1.0 en pares idénticos que fija el signo del
+        # campo Cos del hash de integridad
+        if self.norm_O is None or self.norm_C is None:
+            self.norm_O = self._row_norm(self.V_O)
+            self.norm_C = self._row_norm(self.V_C)
+        U_O = self.V_O / self.norm_O if self.norm_O else self.V_O
+        U_C = self.V_C / self.norm_C if self.norm_C else self.V_C
+        return float(U_O @ U_C)
     
     def kl_divergence(self) -> float:
         """
@@ -110,16 +326,20 @@ class SemanticVectorSpace:
         
         # Normalizar a distribuciones de probabilidad
         # Agregar epsilon para evitar log(0)
-        epsilon = 1e-10
-        P = self.V_O + epsilon
-        Q = self.V_C + epsilon
-        
-        # Normalizar
-        P = P / P.sum()
-        Q = Q / Q.sum()
+        P = self.V_O + self.KL_EPSILON
+        Q = self.V_C + self.KL_EPSILON
+        
+        # Normalizar (in situ: P y Q ya son copias). La segunda pasada y
+        # rel_entr + np.sum reproducen bit a bit scipy.stats.entropy(P, Q),
+        # incluido el signo de los resultados ~0 que entran en el hash de
+        # integridad, sin su validación de argumentos
+        P /= P.sum()
+        Q /= Q.sum()
+        P /= P.sum()
+        Q /= Q.sum()
         
         # Divergencia KL
-        kl_div = scipy_entropy(P, Q)
+        kl_div = np.sum(rel_entr(P, Q))
         
         return float(kl_div)
     
@@ -139,21 +359,16 @@ class SemanticVectorSpace:
         if self.V_O is None or self.V_C is None:
             raise ValueError("Vectores no inicializados.")
         
-        # Umbral para considerar componente "activo"
-        threshold = 1e-6
-        
-        # Dimensión efectiva: número de componentes no-cero
-        dim_O = np.sum(np.abs(self.V_O) > threshold)
-        dim_C = np.sum(np.abs(self.V_C) > threshold)
-        
-        # Intersección: componentes activos en ambos espacios
-        intersection_mask = (np.abs(self.V_O) > threshold) & (np.abs(self.V_C) > threshold)
-        dim_intersection = np.sum(intersection_mask)
+        # Componentes activos (los pesos TF-IDF son no negativos: sin abs)
+        active_O = self.V_O > self.ACTIVE_THRESHOLD
+        active_C = self.V_C > self.ACTIVE_THRESHOLD
         
+        # Dimensión efectiva: número de componentes activos;
+        # intersección: componentes activos en ambos espacios
         return {
-            'dim_V_O': int(dim_O),
-            'dim_V_C': int(dim_C),
-            'dim_intersection': int(dim_intersection)
+            'dim_V_O': int(np.count_nonzero(active_O)),
+            'dim_V_C': int(np.count_nonzero(active_C)),
+            'dim_intersection': int(np.count_nonzero(active_O & active_C))
         }
     
     def get_top_features(self, vector: np.ndarray, top_n: int = 10) -> list:
@@ -191,12 +406,23 @@ class SemanticVectorSpace:
         if self.V_O is None or self.V_C is None:
             raise ValueError("Vectores no inicializados.")
         
-        dims = self.dimensionality_intersection()
-        
-        # Calcular métricas
-        cos_sim = self.cosine_similarity_score()
-        cos_dist = self.cosine_distance()
-        kl_div = self.kl_divergence()
+        # Calcular métricas (en una sola pasada si el kernel está compilado)
+        if _pair_metrics is not None:
+            cos_sim, kl_div, dim_O, dim_C, dim_intersection = _pair_metrics(
+                self.V_O, self.V_C, self.KL_EPSILON, self.ACTIVE_THRESHOLD
+            )
+            cos_sim = float(cos_sim)
+            kl_div = float(kl_div)
+            dims = {
+                'dim_V_O': int(dim_O),
+                'dim_V_C': int(dim_C),
+                'dim_intersection': int(dim_intersection)
+            }
+        else:
+            dims = self.dimensionality_intersection()
+            cos_sim = self.cosine_similarity_score()
+            kl_div = self.kl_divergence()
+        cos_dist = 1.0 - cos_sim
         
         # Overlap ratio
         overlap_ratio = dims['dim_intersection'] / dims['dim_V_O'] if dims['dim_V_O'] > 0 else 0.0
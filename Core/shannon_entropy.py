@@ -12,6 +12,7 @@ import numpy as np
 from typing import List, Dict
 from scipy.stats import entropy as scipy_entropy
 import re
+from ._text_cache import text_cache
 
 
 class ShannonEntropyCalculator:
@@ -20,8 +21,17 @@ class ShannonEntropyCalculator:
     H(X) = -Σ P(x_i) log₂ P(x_i)
     """
     
-    @staticmethod
-    def tokenize(text: str) -> List[str]:
+    # Bytes de los textos cuya entropía se memoiza (p. ej. la misma respuesta
+    # de Origen comparada contra muchas respuestas de Control)
+    CACHE_MAX_BYTES = 4 << 20
+    
+    # Texto ASCII: caracteres eliminados por re.sub(r'[^\w\s]', '', ...)
+    ASCII_PUNCTUATION = str.maketrans({
+        chr(c): None for c in range(128) if not re.match(r'[\w\s]', chr(c))
+    })
+    
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
         """
         Tokenización manteniendo estructura semántica.
         
@@ -31,7 +41,11 @@ class ShannonEntropyCalculator:
         Returns:
             Lista de tokens limpios (lexemas)
         """
-        text_clean = re.sub(r'[^\w\s]', '', text.lower())
+        text_clean = text.lower()
+        if text_clean.isascii():
+            text_clean = text_clean.translate(cls.ASCII_PUNCTUATION)
+        else:
+            text_clean = re.sub(r'[^\w\s]', '', text_clean)
         return [token for token in text_clean.split() if len(token) > 1]
     
     @staticmethod
@@ -53,10 +67,13 @@ class ShannonEntropyCalculator:
         return probabilities
     
     @classmethod
+    @text_cache(max_bytes=CACHE_MAX_BYTES)
     def calculate_entropy(cls, text: str) -> float:
         """
         Calcula H(X) = -Σ P(x_i) log₂ P(x_i)
         
+        Memoizado por texto: H(X) solo depende de su contenido.
+        
         Args:
             text: Texto a analizar
             
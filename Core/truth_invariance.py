@@ -13,7 +13,7 @@ CID: bafybeihqz3x7k5t2m4n6p8r9s1v3w5y7a9c1e3g5i7k9m1o3q5s7u9w1y3
 import numpy as np
 from dataclasses import dataclass
 from typing import List, Dict
-from semantic_vector_space import SemanticVectorSpace
+from .semantic_vector_space import SemanticVectorSpace
 
 
 @dataclass